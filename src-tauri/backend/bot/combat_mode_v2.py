@@ -10,6 +10,7 @@ from utils.image_utils import ImageUtils
 from utils.mouse_utils import MouseUtils
 from bot.combat_mode import CombatMode
 from bot.window import Window
+from utils.parser import Action
 
 class CombatModeV2:
     """ This is a class that manager everything inside a battle
@@ -285,7 +286,7 @@ class CombatModeV2:
         CombatModeV2.actions = []
         for action in actions:
             CombatModeV2.actions.append(
-                (fun[action[0]] , action[1])
+                Action(fun[action.op], action.params)
             )
         Log.print_message(
             f"[COMBAT] Action Loaded: Size {len(CombatModeV2.actions)}")
@@ -348,10 +349,10 @@ class CombatModeV2:
         Log.print_message("######################################################################\n")
 
         first_action = CombatModeV2.actions[0]
-       
-        if first_action[0] == CombatModeV2._enable_semi_auto:
+
+        if first_action.op == CombatModeV2._enable_semi_auto:
             auto_status = 1
-        elif first_action[0] == CombatModeV2._enable_full_auto:
+        elif first_action.op == CombatModeV2._enable_full_auto:
             auto_status = 2
         else:
             auto_status = 0 # enum, 0 for nothin, 1 for semi, 2 for full
@@ -401,7 +402,7 @@ class CombatModeV2:
         action_start_idx = min(auto_status, 1)
         # excute chain actions
         for action in CombatModeV2.actions[action_start_idx:]:
-            action[0](**action[1])
+            action.op(**action.params)
 
         Log.print_message("\n######################################################################")
         Log.print_message("######################################################################")
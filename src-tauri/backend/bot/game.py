@@ -1,13 +1,17 @@
+import concurrent.futures
+import json
 import multiprocessing
+import queue
 import random
 import time
 import traceback
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import pyautogui
 
 # The order of the following imports matter to avoid circular import error.
 from utils.settings import Settings
+from utils.adaptive_sleeper import AdaptiveSleeper
 from utils.message_log import MessageLog
 from utils import discord_utils
 from utils.image_utils import ImageUtils
@@ -35,11 +39,61 @@ class Game:
     """
 
     _discord_process = None
-    _discord_queue = multiprocessing.Queue()
+
+    # The Discord queue is created lazily in start_discord_process() as a Manager queue. A Manager proxy avoids the per-put pickling and locking of a raw
+    # multiprocessing.Queue and, more importantly, costs nothing at all when Discord is disabled.
+    _discord_queue = None
+
+    # Thread pool for searching multiple button image variants concurrently. OpenCV releases the GIL during template matching so the searches run in parallel.
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers = 4)
+
+    # Logical button names that map to several template variants, in order of priority. The first entry doubles as the name used for the click.
+    _BUTTON_VARIANTS = {
+        "quest": ("quest_blue", "quest_red"),
+        "raid": ("raid_flat", "raid_bouncing"),
+        "coop_start": ("coop_start_flat", "coop_start_faded"),
+        "event_special_quest": ("event_special_quest", "event_special_quest_flat", "event_special_quest_bouncing")
+    }
 
     def __init__(self):
         super().__init__()
 
+    _calibration_file = "temp/calibration.json"
+
+    @staticmethod
+    def _try_cached_calibration() -> bool:
+        """Attempt to restore the window calibration saved by a previous run, verifying it is still valid before trusting it.
+
+        Returns:
+            (bool): True if the cached calibration was restored and verified. Otherwise, False.
+        """
+        try:
+            with open(Game._calibration_file) as file:
+                cached = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        # Reject the cache outright if the screen or the window settings changed since it was saved.
+        if cached.get("screen_size") != list(pyautogui.size()) or cached.get("static_window") != Settings.static_window or cached.get("use_first_notch") != Settings.use_first_notch:
+            return False
+
+        # A truncated or hand-edited cache file can be valid JSON but missing keys; treat that like any other invalid cache.
+        try:
+            Settings.home_button_location = tuple(cached["home_button_location"])
+            ImageUtils.update_window_dimensions(cached["window_left"], cached["window_top"], cached["window_width"], cached["window_height"], cached["additional_calibration_required"])
+        except (KeyError, TypeError):
+            return False
+
+        # Make sure the window did not move by checking that the Home button is still findable within the cached region.
+        if ImageUtils.find_button("home", tries = 1, suppress_error = True, bypass_general_adjustment = True) is None:
+            # Roll back the dimensions that were just applied so the fresh calibration that follows searches the full screen
+            # again instead of the stale cached region.
+            ImageUtils.reset_window_dimensions()
+            return False
+
+        MessageLog.print_message("\n[INFO] Restored the window calibration from the previous run.")
+        return True
+
     @staticmethod
     def _calibrate_game_window(display_info_check: bool = False):
         """Recalibrate the dimensions of the bot window for fast and accurate image matching.
@@ -88,6 +142,23 @@ class Game:
 
         ImageUtils.update_window_dimensions(window_left, window_top, window_width, window_height, additional_calibration_required)
 
+        # Persist the calibration so subsequent bot launches can skip the template searches if the window has not moved.
+        try:
+            with open(Game._calibration_file, "w") as file:
+                json.dump({
+                    "screen_size": list(pyautogui.size()),
+                    "static_window": Settings.static_window,
+                    "use_first_notch": Settings.use_first_notch,
+                    "home_button_location": list(Settings.home_button_location),
+                    "window_left": window_left,
+                    "window_top": window_top,
+                    "window_width": window_width,
+                    "window_height": window_height,
+                    "additional_calibration_required": additional_calibration_required
+                }, file)
+        except OSError:
+            MessageLog.print_message("[WARNING] Failed to save the window calibration to disk.")
+
         MessageLog.print_message("[SUCCESS] Dimensions of the window has been successfully recalibrated.")
 
         if display_info_check:
@@ -165,6 +236,69 @@ class Game:
             time.sleep(seconds)
         return None
 
+    @staticmethod
+    def _find_first_button(button_names: List[str], tries: int = 5, custom_confidence: float = 0.80, bypass_general_adjustment: bool = False) -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+        """Search for multiple button image variants concurrently on the same frame and return the first one found.
+
+        Args:
+            button_names (List[str]): Names of the button image files in the /images/buttons/ folder, in order of priority.
+            tries (int, optional): Number of tries before failing. Defaults to 5.
+            custom_confidence (float, optional): Use a custom confidence for the template matching. Defaults to 0.80.
+            bypass_general_adjustment (bool, optional): Bypass using the general adjustment for the number of tries. Defaults to False.
+
+        Returns:
+            (Tuple[Optional[str], Optional[Tuple[int, int]]]): Name and location of the first button found. Otherwise, (None, None).
+        """
+        # Mirror the general adjustment to the number of tries that find_button() would have applied for each variant.
+        if Settings.enable_general_adjustment and bypass_general_adjustment is False and tries == 5:
+            tries = Settings.adjust_button_search_general
+
+        while tries > 0:
+            # Take one screenshot and search it for every variant in parallel. The workers get a private copy since the
+            # shared grab_window() buffer is overwritten by the next capture.
+            screen = ImageUtils.grab_window().copy()
+            futures = [(button_name, Game._executor.submit(ImageUtils.find_button, button_name, custom_confidence = custom_confidence, tries = 1, suppress_error = True,
+                                                           disable_adjustment = True, screenshot = screen)) for button_name in button_names]
+
+            found_name = None
+            found_location = None
+            for button_name, future in futures:
+                # Drain every future even after a hit so no worker is left matching while the caller moves on to the next frame.
+                location = future.result()
+                if location is not None and found_location is None:
+                    found_name = button_name
+                    found_location = location
+
+            if found_location is not None:
+                return found_name, found_location
+
+            tries -= 1
+
+        return None, None
+
+    @staticmethod
+    def wait_until(image_name: str, timeout: float = 5.0, interval: float = 0.05) -> bool:
+        """Wait until the specified button image appears on the screen instead of sleeping for a fixed amount of time.
+
+        Args:
+            image_name (str): Name of the button image file in the /images/buttons/ folder to wait for.
+            timeout (float, optional): Maximum number of seconds to wait before giving up. Defaults to 5.0.
+            interval (float, optional): Number of seconds to sleep between polls. Defaults to 0.05.
+
+        Returns:
+            (bool): True if the button appeared within the timeout. Otherwise, False.
+        """
+        deadline = time.time() + timeout
+
+        while time.time() < deadline:
+            screen = ImageUtils.grab_window()
+            if ImageUtils.find_button(image_name, tries = 1, suppress_error = True, screenshot = screen) is not None:
+                return True
+
+            time.sleep(interval)
+
+        return False
+
     @staticmethod
     def find_and_click_button(button_name: str, clicks: int = 1, tries: int = 0, x_offset: int = 0, y_offset: int = 0, custom_confidence: float = 0.80, suppress_error: bool = False,
                               bypass_general_adjustment: bool = True, custom_wait: Optional[float] = None):
@@ -187,88 +321,33 @@ class Game:
         if Settings.debug_mode:
             MessageLog.print_message(f"\n[DEBUG] Attempting to find and click the button: \"{button_name}\".")
 
-        if tries == 0:
-            if button_name.lower() == "quest":
-                temp_location = ImageUtils.find_button("quest_blue", custom_confidence = custom_confidence)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("quest_red", custom_confidence = custom_confidence)
-
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "quest_blue", mouse_clicks = clicks)
-                    return True
-            elif button_name.lower() == "raid":
-                temp_location = ImageUtils.find_button("raid_flat", custom_confidence = custom_confidence)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("raid_bouncing", custom_confidence = custom_confidence)
-
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "raid_flat", mouse_clicks = clicks)
-                    return True
-            elif button_name.lower() == "coop_start":
-                temp_location = ImageUtils.find_button("coop_start_flat", custom_confidence = custom_confidence)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("coop_start_faded", custom_confidence = custom_confidence)
+        lowered_button_name = button_name.lower()
 
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "coop_start_flat", mouse_clicks = clicks)
-                    return True
-            elif button_name.lower() == "event_special_quest":
-                temp_location = ImageUtils.find_button("event_special_quest", custom_confidence = custom_confidence)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("event_special_quest_flat", custom_confidence = custom_confidence)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("event_special_quest_bouncing", custom_confidence = custom_confidence)
+        # Ignore the "Play Again" button once the Defender quota has been met.
+        if lowered_button_name == "play_again" and Settings.enable_defender and Settings.engaged_defender_battle and Settings.number_of_defeated_defenders >= Settings.number_of_defenders:
+            return False
 
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "event_special_quest", mouse_clicks = clicks)
-                    return True
-            elif button_name.lower() == "play_again" and Settings.enable_defender and Settings.engaged_defender_battle and Settings.number_of_defeated_defenders >= Settings.number_of_defenders:
-                    return False
+        candidates = Game._BUTTON_VARIANTS.get(lowered_button_name)
+        if candidates is not None:
+            # Buttons with multiple visual variants are searched concurrently, one frame per round.
+            if tries == 0:
+                _, temp_location = Game._find_first_button(list(candidates), custom_confidence = custom_confidence)
             else:
-                temp_location = ImageUtils.find_button(button_name.lower(), custom_confidence = custom_confidence)
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, button_name, mouse_clicks = clicks)
-                    return True
-        else:
-            if button_name.lower() == "quest":
-                temp_location = ImageUtils.find_button("quest_blue", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("quest_red", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "quest_blue", mouse_clicks = clicks)
-                    return True
-            elif button_name.lower() == "raid":
-                temp_location = ImageUtils.find_button("raid_flat", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("raid_bouncing", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "raid_flat", mouse_clicks = clicks)
-                    return True
-            elif button_name.lower() == "coop_start":
-                temp_location = ImageUtils.find_button("coop_start_flat", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("coop_start_faded", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-
-                if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "coop_start_flat", mouse_clicks = clicks)
-                    return True
-            elif button_name.lower() == "event_special_quest":
-                temp_location = ImageUtils.find_button("event_special_quest", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("event_special_quest_flat", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
-                if temp_location is None:
-                    temp_location = ImageUtils.find_button("event_special_quest_bouncing", tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
+                _, temp_location = Game._find_first_button(list(candidates), tries = tries, custom_confidence = custom_confidence, bypass_general_adjustment = bypass_general_adjustment)
 
+            if temp_location is not None:
+                MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, candidates[0], mouse_clicks = clicks)
+                return True
+        else:
+            screen = ImageUtils.grab_window()
+            if tries == 0:
+                temp_location = ImageUtils.find_button(lowered_button_name, custom_confidence = custom_confidence, screenshot = screen)
                 if temp_location is not None:
-                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, "event_special_quest", mouse_clicks = clicks)
+                    MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, button_name, mouse_clicks = clicks)
                     return True
-            elif button_name.lower() == "play_again" and Settings.enable_defender and Settings.engaged_defender_battle and Settings.number_of_defeated_defenders >= Settings.number_of_defenders:
-                    return False
             else:
-                temp_location = ImageUtils.find_button(button_name.lower(), tries = tries, suppress_error = suppress_error, custom_confidence = custom_confidence,
-                                                       bypass_general_adjustment = bypass_general_adjustment)
+                temp_location = ImageUtils.find_button(lowered_button_name, tries = tries, suppress_error = suppress_error, custom_confidence = custom_confidence,
+                                                       bypass_general_adjustment = bypass_general_adjustment, screenshot = screen)
                 if temp_location is not None:
                     MouseUtils.move_and_click_point(temp_location[0] + x_offset, temp_location[1] + y_offset, button_name, mouse_clicks = clicks, custom_wait=custom_wait)
                     return True
@@ -290,7 +369,7 @@ class Game:
 
             return None
         except RuntimeError:
-            Game._discord_queue.put(f"> Bot encountered exception while checking for CAPTCHA: \n{traceback.format_exc()}")
+            Game._discord_put(f"> Bot encountered exception while checking for CAPTCHA: \n{traceback.format_exc()}")
             MessageLog.print_message(f"\n[ERROR] Bot encountered exception while checking for CAPTCHA: \n{traceback.format_exc()}")
             ImageUtils.generate_alert_for_captcha()
 
@@ -301,25 +380,13 @@ class Game:
         Returns:
             None
         """
+        # The delay values were already validated when Settings loaded them.
         if Settings.enable_delay_between_runs:
-            # Check if the provided delay is valid.
-            if int(Settings.delay_in_seconds) < 0:
-                MessageLog.print_message("\n[INFO] Provided delay in seconds for the resting period is not valid. Defaulting to 15 seconds.")
-                Settings.delay_in_seconds = 15
-
             MessageLog.print_message(f"\n[INFO] Now waiting for {Settings.delay_in_seconds} seconds as the resting period. Please do not navigate from the current screen.")
 
-            Game.wait(int(Settings.delay_in_seconds))
+            Game.wait(Settings.delay_in_seconds)
         elif not Settings.enable_delay_between_runs and Settings.enable_randomized_delay_between_runs:
-            # Check if the lower and upper bounds are valid.
-            if int(Settings.delay_in_seconds_lower_bound) < 0 or int(Settings.delay_in_seconds_lower_bound) > int(Settings.delay_in_seconds_upper_bound):
-                MessageLog.print_message("\n[INFO] Provided lower bound delay in seconds for the resting period is not valid. Defaulting to 15 seconds.")
-                Settings.delay_in_seconds_lower_bound = 15
-            if int(Settings.delay_in_seconds_upper_bound) < 0 or int(Settings.delay_in_seconds_upper_bound) < int(Settings.delay_in_seconds_lower_bound):
-                MessageLog.print_message("\n[INFO] Provided upper bound delay in seconds for the resting period is not valid. Defaulting to 60 seconds.")
-                Settings.delay_in_seconds_upper_bound = 60
-
-            new_seconds = random.randrange(int(Settings.delay_in_seconds_lower_bound), int(Settings.delay_in_seconds_upper_bound))
+            new_seconds = random.randrange(Settings.delay_in_seconds_lower_bound, Settings.delay_in_seconds_upper_bound)
             MessageLog.print_message(
                 f"\n[INFO] Given the bounds of ({Settings.delay_in_seconds_lower_bound}, {Settings.delay_in_seconds_upper_bound}), bot will now wait for {new_seconds} seconds as a resting period. Please do not navigate from the current screen.")
 
@@ -373,13 +440,11 @@ class Game:
         """
         MessageLog.print_message("\n[INFO] Starting process for Support Summon Selection...")
 
-        # Format the Summon name and Summon element name strings.
-        for idx, summon in enumerate(summon_list):
-            summon_list[idx] = summon.lower().replace(" ", "_")
-        for idx, summon_ele in enumerate(summon_element_list):
-            summon_element_list[idx] = summon_ele.lower()
+        # Format the Summon name and Summon element name strings into new lists so the caller's lists are left untouched.
+        formatted_summon_list = [summon.lower().replace(" ", "_") for summon in summon_list]
+        formatted_summon_element_list = [summon_ele.lower() for summon_ele in summon_element_list]
 
-        summon_location = ImageUtils.find_summon(summon_list, summon_element_list)
+        summon_location = ImageUtils.find_summon(formatted_summon_list, formatted_summon_element_list)
         if summon_location is not None:
             MouseUtils.move_and_click_point(summon_location[0], summon_location[1], "template_support_summon", mouse_clicks = 2)
 
@@ -432,14 +497,23 @@ class Game:
                 choose_a_summon_location = ImageUtils.find_button("choose_a_summon")
                 MouseUtils.move_and_click_point(choose_a_summon_location[0], choose_a_summon_location[1] + 187, "choose_a_summon")
 
-                # Now start the Old Lignoid Trial Battle right away and then wait a few seconds.
+                # Now start the Old Lignoid Trial Battle right away and wait for the battle screen to appear.
                 Game.find_and_click_button("party_selection_ok")
-                Game.wait(3.0)
+                Game.wait_until("menu", timeout = 10.0)
+
+                # Retreat from this Trial Battle. Instead of three separate 30-try search chains, each round takes one screenshot,
+                # checks all of the flow's buttons against it concurrently and clicks whichever state is currently on screen.
+                retreat_tries = 30
+                while retreat_tries > 0:
+                    found_button, found_location = Game._find_first_button(["retreat_confirmation", "retreat", "menu"], tries = 1)
+
+                    if found_button is not None:
+                        MouseUtils.move_and_click_point(found_location[0], found_location[1], found_button)
+                        if found_button == "retreat_confirmation":
+                            break
+
+                    retreat_tries -= 1
 
-                # Retreat from this Trial Battle.
-                Game.find_and_click_button("menu", tries = 30)
-                Game.find_and_click_button("retreat", tries = 30)
-                Game.find_and_click_button("retreat_confirmation", tries = 30)
                 Game.go_back_home()
 
                 if ImageUtils.confirm_location("home"):
@@ -479,26 +553,26 @@ class Game:
             else:
                 if Settings.farming_mode == "Raid" and ImageUtils.find_button("party_set_extra", tries = 3):
                     MessageLog.print_message(f"[INFO] Skipping Set Selection due to Raid only allowing parties from the Extra category.")
-                elif group_number < 8:
-                    while set_location is None:
-                        set_location = ImageUtils.find_button("party_set_a")
-                        if set_location is None:
-                            tries -= 1
-                            if tries <= 0:
-                                raise RuntimeError("Could not find Set A.")
-
-                            # See if the user had Set B active instead of Set A if matching failed.
-                            Game.find_and_click_button("party_set_b")
                 else:
+                    if group_number < 8:
+                        wanted_set, wanted_set_name = "party_set_a", "Set A"
+                    else:
+                        wanted_set, wanted_set_name = "party_set_b", "Set B"
+
                     while set_location is None:
-                        set_location = ImageUtils.find_button("party_set_b")
-                        if set_location is None:
+                        # Search for both Set buttons concurrently on the same frame to determine which Set is currently active.
+                        found_set, found_location = Game._find_first_button(["party_set_a", "party_set_b"], tries = 1)
+
+                        if found_set == wanted_set:
+                            set_location = found_location
+                        else:
                             tries -= 1
                             if tries <= 0:
-                                raise RuntimeError("Could not find Set B.")
+                                raise RuntimeError(f"Could not find {wanted_set_name}.")
 
-                            # See if the user had Set A active instead of Set B if matching failed.
-                            Game.find_and_click_button("party_set_a")
+                            # The user had the other Set active instead so toggle over to the wanted one.
+                            if found_set is not None:
+                                MouseUtils.move_and_click_point(found_location[0], found_location[1], found_set)
 
             # Center the mouse on the "Set A" / "Set B" button and then click the correct Group tab.
             if Settings.debug_mode:
@@ -514,20 +588,8 @@ class Game:
                 x_inc = 40
                 y_offset = 40
 
-            if group_number == 1 or group_number == 8:
-                x = set_location[0] - x_offset + (x_inc * 0)
-            elif group_number == 2 or group_number == 9:
-                x = set_location[0] - x_offset + (x_inc * 1)
-            elif group_number == 3 or group_number == 10:
-                x = set_location[0] - x_offset + (x_inc * 2)
-            elif group_number == 4 or group_number == 11:
-                x = set_location[0] - x_offset + (x_inc * 3)
-            elif group_number == 5 or group_number == 12:
-                x = set_location[0] - x_offset + (x_inc * 4)
-            elif group_number == 6 or group_number == 13:
-                x = set_location[0] - x_offset + (x_inc * 5)
-            else:
-                x = set_location[0] - x_offset + (x_inc * 6)
+            # Groups 1-7 are in Set A and 8-14 are in Set B, so both map onto the same 7 tab positions.
+            x = set_location[0] - x_offset + (x_inc * ((group_number - 1) % 7))
             y = set_location[1] + y_offset
 
             MouseUtils.move_and_click_point(x, y, "template_group", mouse_clicks = 2)
@@ -546,21 +608,8 @@ class Game:
                 x_inc = 40
                 y_offset = 220
 
-            if party_number == 1 or party_number == 8:
-                x = set_location[0] - x_offset + (x_inc * 0)
-            elif party_number == 2 or party_number == 9:
-                x = set_location[0] - x_offset + (x_inc * 1)
-            elif party_number == 3 or party_number == 10:
-                x = set_location[0] - x_offset + (x_inc * 2)
-            elif party_number == 4 or party_number == 11:
-                x = set_location[0] - x_offset + (x_inc * 3)
-            elif party_number == 5 or party_number == 12:
-                x = set_location[0] - x_offset + (x_inc * 4)
-            elif party_number == 6 or party_number == 13:
-                x = set_location[0] - x_offset + (x_inc * 5)
-            else:
-                x = set_location[0] - x_offset + (x_inc * 6)
-
+            # Parties wrap the same way as Groups do across the two Sets.
+            x = set_location[0] - x_offset + (x_inc * ((party_number - 1) % 7))
             y = set_location[1] + y_offset
 
             MouseUtils.move_and_click_point(x, y, "template_party", mouse_clicks = 2)
@@ -591,12 +640,20 @@ class Game:
         Returns:
             None
         """
-        Game.wait(3)
+        # Poll in short intervals instead of sleeping for a fixed 3 seconds, checking both outcomes against the same frame each round.
+        for _ in range(6):
+            screen = ImageUtils.grab_window()
 
-        if ImageUtils.confirm_location("not_enough_ap", tries = 2):
-            raise RuntimeError("AP auto-restore check failed. Please enable the auto-restore option in the in-game settings according to the GitHub instructions.")
-        else:
-            MessageLog.print_message("\n[INFO] AP auto-restore check passed. Continuing to Party Selection...")
+            if ImageUtils.confirm_location("not_enough_ap", tries = 1, suppress_error = True, screenshot = screen):
+                raise RuntimeError("AP auto-restore check failed. Please enable the auto-restore option in the in-game settings according to the GitHub instructions.")
+
+            # Reaching the Summon Selection screen means the AP cost was paid successfully.
+            if ImageUtils.confirm_location("select_a_summon", tries = 1, suppress_error = True, screenshot = screen):
+                break
+
+            Game.wait(0.5)
+
+        MessageLog.print_message("\n[INFO] AP auto-restore check passed. Continuing to Party Selection...")
 
         return None
 
@@ -607,12 +664,21 @@ class Game:
         Returns:
             None
         """
-        Game.wait(3)
+        if Settings.farming_mode.lower() == "raid":
+            # Poll in short intervals instead of sleeping for a fixed 3 seconds, checking both outcomes against the same frame each round.
+            for _ in range(6):
+                screen = ImageUtils.grab_window()
 
-        if Settings.farming_mode.lower() == "raid" and ImageUtils.confirm_location("not_enough_ep", tries = 2):
-            raise RuntimeError("EP auto-restore check failed. Please enable the auto-restore option in the in-game settings according to the GitHub instructions.")
-        else:
-            MessageLog.print_message("[INFO] EP auto-restore check passed. Continuing to Party Selection...")
+                if ImageUtils.confirm_location("not_enough_ep", tries = 1, suppress_error = True, screenshot = screen):
+                    raise RuntimeError("EP auto-restore check failed. Please enable the auto-restore option in the in-game settings according to the GitHub instructions.")
+
+                # Reaching the Summon Selection screen means the EP cost was paid successfully.
+                if ImageUtils.confirm_location("select_a_summon", tries = 1, suppress_error = True, screenshot = screen):
+                    break
+
+                Game.wait(0.5)
+
+        MessageLog.print_message("[INFO] EP auto-restore check passed. Continuing to Party Selection...")
 
         return None
 
@@ -636,28 +702,56 @@ class Game:
         # Close all popups until the bot reaches the Loot Collected screen.
         if skip_popup_check is False:
             loot_collection_tries = 30
-            while not ImageUtils.confirm_location("loot_collected", tries = 1, disable_adjustment = True):
-                loot_collection_tries -= 1
-                if loot_collection_tries <= 0:
-                    raise RuntimeError("Unable to progress in the Loot Collection process.")
+            last_frame_hash = None
+            acted_last_round = True
+            sleeper = AdaptiveSleeper()
+
+            # Capture on a background thread so the next frame is already in hand while this thread runs the template matches.
+            ImageUtils.start_screenshot_pump()
+            try:
+                while loot_collection_tries > 0:
+                    screen, frame_hash = ImageUtils.get_latest_frame()
+
+                    # If the screen has not changed since a round that found nothing, skip the whole template cascade and back off until it updates.
+                    if frame_hash == last_frame_hash and acted_last_round is False:
+                        loot_collection_tries -= 1
+                        sleeper.wait()
+                        continue
+                    sleeper.reset()
+                    last_frame_hash = frame_hash
+
+                    if ImageUtils.confirm_location("loot_collected", tries = 1, disable_adjustment = True, screenshot = screen):
+                        break
 
-                Game.find_and_click_button("ok", tries = 1, suppress_error = True)
-                Game.find_and_click_button("close", tries = 1, suppress_error = True)
-                Game.find_and_click_button("cancel", tries = 1, suppress_error = True)
+                    loot_collection_tries -= 1
+                    if loot_collection_tries <= 0:
+                        raise RuntimeError("Unable to progress in the Loot Collection process.")
 
-                # Search for and click on the "Extended Mastery" popup.
-                Game.find_and_click_button("new_extended_mastery_level", tries = 1, suppress_error = True)
+                    # Attempt to close any popup, including the "Extended Mastery" one, by matching all the candidates against the same frame.
+                    found_button, found_location = ImageUtils.find_any_button(["ok", "close", "cancel", "new_extended_mastery_level"], screenshot = screen)
+                    if found_button is not None:
+                        MouseUtils.move_and_click_point(found_location[0], found_location[1], found_button)
+                        acted_last_round = True
+                    else:
+                        acted_last_round = False
 
-                if ImageUtils.confirm_location("no_loot", tries = 1, suppress_error = True, disable_adjustment = True):
-                    return None
+                    if ImageUtils.confirm_location("no_loot", tries = 1, suppress_error = True, disable_adjustment = True):
+                        return None
 
-                if Settings.debug_mode:
-                    MessageLog.print_message("[DEBUG] Have not detected the Loot Collection screen yet...")
+                    if Settings.debug_mode:
+                        MessageLog.print_message("[DEBUG] Have not detected the Loot Collection screen yet...")
+
+                # The frozen-frame branch above can also run the counter down, in which case the loop exits by exhaustion
+                # instead of reaching the in-loop raise.
+                if loot_collection_tries <= 0:
+                    raise RuntimeError("Unable to progress in the Loot Collection process.")
+            finally:
+                ImageUtils.stop_screenshot_pump()
 
         # Now that the bot is at the Loot Collected screen, detect any user-specified items.
         if is_completed and not is_pending_battle and not is_event_nightmare and not is_defender and not is_herald:
             MessageLog.print_message("\n[INFO] Detecting if any user-specified loot dropped from this run...")
-            if Settings.item_name != "EXP" and Settings.item_name != "Angel Halo Weapons" and Settings.item_name != "Repeated Runs":
+            if Settings.item_is_countable:
                 temp_amount = ImageUtils.find_farmed_items(Settings.item_name)
             else:
                 temp_amount = 1
@@ -666,7 +760,7 @@ class Game:
             Settings.item_amount_farmed += temp_amount
         elif is_pending_battle:
             MessageLog.print_message("\n[INFO] Detecting if any user-specified loot dropped from this pending battle...")
-            if Settings.item_name != "EXP" and Settings.item_name != "Angel Halo Weapons" and Settings.item_name != "Repeated Runs":
+            if Settings.item_is_countable:
                 temp_amount = ImageUtils.find_farmed_items(Settings.item_name)
             else:
                 temp_amount = 0
@@ -681,91 +775,83 @@ class Game:
                 Game._send_api_result(temp_amount, Settings.combat_elapsed_time)
 
         if is_completed and not is_pending_battle and not is_event_nightmare and not skip_info and not is_defender and not is_herald:
-            if Settings.item_name != "EXP" and Settings.item_name != "Angel Halo Weapons" and Settings.item_name != "Repeated Runs":
-                MessageLog.print_message("\n**********************************************************************")
-                MessageLog.print_message("**********************************************************************")
-                MessageLog.print_message(f"[FARM] Farming Mode: {Settings.farming_mode}")
-                MessageLog.print_message(f"[FARM] Mission: {Settings.mission_name}")
-                MessageLog.print_message(f"[FARM] Summons: {Settings.summon_list}")
-                MessageLog.print_message(f"[FARM] Amount of {Settings.item_name} gained from this run: {temp_amount}")
-                MessageLog.print_message(f"[FARM] Amount of {Settings.item_name} gained in total: {Settings.item_amount_farmed} / {Settings.item_amount_to_farm}")
-                MessageLog.print_message(f"[FARM] Amount of runs completed: {Settings.amount_of_runs_finished}")
-                MessageLog.print_message("**********************************************************************")
-                MessageLog.print_message("**********************************************************************\n")
+            if Settings.item_is_countable:
+                MessageLog.print_messages([
+                    "\n**********************************************************************",
+                    "**********************************************************************",
+                    f"[FARM] Farming Mode: {Settings.farming_mode}",
+                    f"[FARM] Mission: {Settings.mission_name}",
+                    f"[FARM] Summons: {Settings.summon_list}",
+                    f"[FARM] Amount of {Settings.item_name} gained from this run: {temp_amount}",
+                    f"[FARM] Amount of {Settings.item_name} gained in total: {Settings.item_amount_farmed} / {Settings.item_amount_to_farm}",
+                    f"[FARM] Amount of runs completed: {Settings.amount_of_runs_finished}",
+                    "**********************************************************************",
+                    "**********************************************************************\n"
+                ])
 
                 if temp_amount != 0:
-                    if Settings.item_amount_farmed >= Settings.item_amount_to_farm:
-                        discord_string = f"> {temp_amount}x __{Settings.item_name}__ gained from this run: **[{Settings.item_amount_farmed - temp_amount} / {Settings.item_amount_to_farm}]** -> " \
-                                         f"**[{Settings.item_amount_farmed} / {Settings.item_amount_to_farm}]** :white_check_mark:"
-                    else:
-                        discord_string = f"> {temp_amount}x __{Settings.item_name}__ gained from this run: **[{Settings.item_amount_farmed - temp_amount} / {Settings.item_amount_to_farm}]** -> " \
-                                         f"**[{Settings.item_amount_farmed} / {Settings.item_amount_to_farm}]**"
-
-                    Game._discord_queue.put(discord_string)
+                    Game._discord_put(Game._build_discord_drop_string(f"> {temp_amount}x __{Settings.item_name}__ gained from this run",
+                                                                      Settings.item_amount_farmed - temp_amount, Settings.item_amount_farmed, Settings.item_amount_to_farm))
             else:
-                MessageLog.print_message("\n**********************************************************************")
-                MessageLog.print_message("**********************************************************************")
-                MessageLog.print_message(f"[FARM] Farming Mode: {Settings.farming_mode}")
-                MessageLog.print_message(f"[FARM] Mission: {Settings.mission_name}")
-                MessageLog.print_message(f"[FARM] Summons: {Settings.summon_list}")
-                MessageLog.print_message(f"[FARM] Amount of runs completed: {Settings.amount_of_runs_finished} / {Settings.item_amount_to_farm}")
-                MessageLog.print_message("**********************************************************************")
-                MessageLog.print_message("**********************************************************************\n")
-
-                if Settings.amount_of_runs_finished >= Settings.item_amount_to_farm:
-                    discord_string = f"> Runs completed for __{Settings.mission_name}__: **[{Settings.amount_of_runs_finished - 1} / {Settings.item_amount_to_farm}]** -> " \
-                                     f"**[{Settings.amount_of_runs_finished} / {Settings.item_amount_to_farm}]** :white_check_mark:"
-                else:
-                    discord_string = f"> Runs completed for __{Settings.mission_name}__: **[{Settings.amount_of_runs_finished - 1} / {Settings.item_amount_to_farm}]** -> " \
-                                     f"**[{Settings.amount_of_runs_finished} / {Settings.item_amount_to_farm}]**"
-
-                Game._discord_queue.put(discord_string)
+                MessageLog.print_messages([
+                    "\n**********************************************************************",
+                    "**********************************************************************",
+                    f"[FARM] Farming Mode: {Settings.farming_mode}",
+                    f"[FARM] Mission: {Settings.mission_name}",
+                    f"[FARM] Summons: {Settings.summon_list}",
+                    f"[FARM] Amount of runs completed: {Settings.amount_of_runs_finished} / {Settings.item_amount_to_farm}",
+                    "**********************************************************************",
+                    "**********************************************************************\n"
+                ])
+
+                Game._discord_put(Game._build_discord_drop_string(f"> Runs completed for __{Settings.mission_name}__",
+                                                                  Settings.amount_of_runs_finished - 1, Settings.amount_of_runs_finished, Settings.item_amount_to_farm))
         elif is_pending_battle and temp_amount > 0 and not skip_info:
-            if Settings.item_name != "EXP" and Settings.item_name != "Angel Halo Weapons" and Settings.item_name != "Repeated Runs":
-                MessageLog.print_message("\n**********************************************************************")
-                MessageLog.print_message("**********************************************************************")
-                MessageLog.print_message(f"[FARM] Farming Mode: {Settings.farming_mode}")
-                MessageLog.print_message(f"[FARM] Mission: {Settings.mission_name}")
-                MessageLog.print_message(f"[FARM] Summons: {Settings.summon_list}")
-                MessageLog.print_message(f"[FARM] Amount of {Settings.item_name} gained from this pending battle: {temp_amount}")
-                MessageLog.print_message(f"[FARM] Amount of {Settings.item_name} gained in total: {Settings.item_amount_farmed} / {Settings.item_amount_to_farm}")
-                MessageLog.print_message(f"[FARM] Amount of runs completed: {Settings.amount_of_runs_finished}")
-                MessageLog.print_message("**********************************************************************")
-                MessageLog.print_message("**********************************************************************\n")
+            if Settings.item_is_countable:
+                MessageLog.print_messages([
+                    "\n**********************************************************************",
+                    "**********************************************************************",
+                    f"[FARM] Farming Mode: {Settings.farming_mode}",
+                    f"[FARM] Mission: {Settings.mission_name}",
+                    f"[FARM] Summons: {Settings.summon_list}",
+                    f"[FARM] Amount of {Settings.item_name} gained from this pending battle: {temp_amount}",
+                    f"[FARM] Amount of {Settings.item_name} gained in total: {Settings.item_amount_farmed} / {Settings.item_amount_to_farm}",
+                    f"[FARM] Amount of runs completed: {Settings.amount_of_runs_finished}",
+                    "**********************************************************************",
+                    "**********************************************************************\n"
+                ])
 
                 if temp_amount != 0:
-                    if Settings.item_amount_farmed >= Settings.item_amount_to_farm:
-                        discord_string = f"> {temp_amount}x __{Settings.item_name}__ gained from this pending battle: **[{Settings.item_amount_farmed - temp_amount} / {Settings.item_amount_to_farm}]** -> " \
-                                         f"**[{Settings.item_amount_farmed} / {Settings.item_amount_to_farm}]** :white_check_mark:"
-                    else:
-                        discord_string = f"> {temp_amount}x __{Settings.item_name}__ gained from this pending battle: **[{Settings.item_amount_farmed - temp_amount} / {Settings.item_amount_to_farm}]** -> " \
-                                         f"**[{Settings.item_amount_farmed} / {Settings.item_amount_to_farm}]**"
-
-                    Game._discord_queue.put(discord_string)
+                    Game._discord_put(Game._build_discord_drop_string(f"> {temp_amount}x __{Settings.item_name}__ gained from this pending battle",
+                                                                      Settings.item_amount_farmed - temp_amount, Settings.item_amount_farmed, Settings.item_amount_to_farm))
         elif is_herald:
             Settings.number_of_defeated_heralds += 1
             Settings.engaged_herald_battle = False
             if Settings.no_party_selection:
                 Settings.party_selection_first_run = True
                 Settings.no_party_selection = False
-            MessageLog.print_message("\n**********************************************************************")
-            MessageLog.print_message("**********************************************************************")
-            MessageLog.print_message(f"[FARM] Farming Mode: {Settings.farming_mode}")
-            MessageLog.print_message(f"[FARM] Mission: {Settings.mission_name}")
-            MessageLog.print_message(f"[FARM] Summons: {Settings.summon_list}")
-            MessageLog.print_message(f"[FARM] Amount of Heralds defeated: {Settings.number_of_defeated_heralds}/{Settings.number_of_heralds}")
-            MessageLog.print_message("**********************************************************************")
-            MessageLog.print_message("**********************************************************************\n")
+            MessageLog.print_messages([
+                "\n**********************************************************************",
+                "**********************************************************************",
+                f"[FARM] Farming Mode: {Settings.farming_mode}",
+                f"[FARM] Mission: {Settings.mission_name}",
+                f"[FARM] Summons: {Settings.summon_list}",
+                f"[FARM] Amount of Heralds defeated: {Settings.number_of_defeated_heralds}/{Settings.number_of_heralds}",
+                "**********************************************************************",
+                "**********************************************************************\n"
+            ])
         elif is_defender:
             Settings.number_of_defeated_defenders += 1
-            MessageLog.print_message("\n**********************************************************************")
-            MessageLog.print_message("**********************************************************************")
-            MessageLog.print_message(f"[FARM] Farming Mode: {Settings.farming_mode}")
-            MessageLog.print_message(f"[FARM] Mission: {Settings.mission_name}")
-            MessageLog.print_message(f"[FARM] Summons: {Settings.summon_list}")
-            MessageLog.print_message(f"[FARM] Amount of Defenders defeated: {Settings.number_of_defeated_defenders}/{Settings.number_of_defenders}")
-            MessageLog.print_message("**********************************************************************")
-            MessageLog.print_message("**********************************************************************\n")
+            MessageLog.print_messages([
+                "\n**********************************************************************",
+                "**********************************************************************",
+                f"[FARM] Farming Mode: {Settings.farming_mode}",
+                f"[FARM] Mission: {Settings.mission_name}",
+                f"[FARM] Summons: {Settings.summon_list}",
+                f"[FARM] Amount of Defenders defeated: {Settings.number_of_defeated_defenders}/{Settings.number_of_defenders}",
+                "**********************************************************************",
+                "**********************************************************************\n"
+            ])
 
         return None
 
@@ -779,32 +865,76 @@ class Game:
         MessageLog.print_message(f"\n[INFO] Now beginning process to check for popups...")
 
         check_popup_tries = 30
-        while ImageUtils.confirm_location("select_a_summon", tries = 1, suppress_error = True) is False:
-            check_popup_tries -= 1
-            if check_popup_tries <= 0:
-                raise RuntimeError("Failed to progress in the Check for Popups process...")
-
-            if Settings.farming_mode == "Rise of the Beasts" and ImageUtils.confirm_location("proud_solo_quest", tries = 1):
-                # Scroll down the screen a little bit because the popup itself is too long for screen sizes around 1080p.
-                MouseUtils.scroll_screen_from_home_button(-400)
-
-            # Check for certain popups for certain Farming Modes.
-            if (Settings.farming_mode == "Rise of the Beasts" and RiseOfTheBeasts.check_for_rotb_extreme_plus()) or (
-                    Settings.farming_mode == "Special" and Settings.mission_name == "VH Angel Halo" and Settings.item_name == "Angel Halo Weapons" and Special.check_for_dimensional_halo()) or (
-                    (Settings.farming_mode == "Event" or Settings.farming_mode == "Event (Token Drawboxes)") and Event.check_for_event_nightmare()):
-                return True
+        last_frame_hash = None
+        acted_last_round = True
+        sleeper = AdaptiveSleeper()
 
-            # If the bot tried to repeat a Extreme/Impossible difficulty Event Raid and it lacked the treasures to host it, go back to select the Mission again.
-            if (Settings.farming_mode == "Event (Token Drawboxes)" or Settings.farming_mode == "Guild Wars") and ImageUtils.confirm_location("not_enough_treasure", tries = 1):
-                Game.find_and_click_button("ok")
-                return True
+        # Capture on a background thread so the next frame is already in hand while this thread runs the template matches.
+        ImageUtils.start_screenshot_pump()
+        try:
+            while check_popup_tries > 0:
+                screen, frame_hash = ImageUtils.get_latest_frame()
+
+                # If the screen has not changed since a round that found nothing, skip the template cascade entirely and back off until it updates.
+                if frame_hash == last_frame_hash and acted_last_round is False:
+                    check_popup_tries -= 1
+                    sleeper.wait()
+                    continue
+                sleeper.reset()
+                last_frame_hash = frame_hash
+
+                if ImageUtils.confirm_location("select_a_summon", tries = 1, suppress_error = True, screenshot = screen):
+                    return False
 
-            # Attempt to close any popup by clicking on any detected "Close" and "Cancel" buttons.
-            if Game.find_and_click_button("close", tries = 1, suppress_error = True) is False:
-                Game.find_and_click_button("cancel", tries = 1, suppress_error = True)
+                check_popup_tries -= 1
+                if check_popup_tries <= 0:
+                    raise RuntimeError("Failed to progress in the Check for Popups process...")
 
-            if Settings.debug_mode:
-                MessageLog.print_message("[DEBUG] Have not detected the Support Summon Selection screen yet...")
+                if Settings.farming_mode == "Rise of the Beasts" and ImageUtils.confirm_location("proud_solo_quest", tries = 1, screenshot = screen):
+                    # Scroll down the screen a little bit because the popup itself is too long for screen sizes around 1080p.
+                    MouseUtils.scroll_screen_from_home_button(-400)
+
+                # Check for certain popups for certain Farming Modes.
+                if (Settings.farming_mode == "Rise of the Beasts" and RiseOfTheBeasts.check_for_rotb_extreme_plus()) or (
+                        Settings.farming_mode == "Special" and Settings.mission_name == "VH Angel Halo" and Settings.item_name == "Angel Halo Weapons" and Special.check_for_dimensional_halo()) or (
+                        (Settings.farming_mode == "Event" or Settings.farming_mode == "Event (Token Drawboxes)") and Event.check_for_event_nightmare()):
+                    return True
+
+                # If the bot tried to repeat a Extreme/Impossible difficulty Event Raid and it lacked the treasures to host it, go back to select the Mission again.
+                if (Settings.farming_mode == "Event (Token Drawboxes)" or Settings.farming_mode == "Guild Wars") and ImageUtils.confirm_location("not_enough_treasure", tries = 1, screenshot = screen):
+                    Game.find_and_click_button("ok")
+                    return True
+
+                # Attempt to close any popup by clicking on any detected "Close" and "Cancel" buttons.
+                acted_last_round = Game.find_and_click_button("close", tries = 1, suppress_error = True)
+                if acted_last_round is False:
+                    acted_last_round = Game.find_and_click_button("cancel", tries = 1, suppress_error = True)
+
+                if Settings.debug_mode:
+                    MessageLog.print_message("[DEBUG] Have not detected the Support Summon Selection screen yet...")
+        finally:
+            ImageUtils.stop_screenshot_pump()
+
+        raise RuntimeError("Failed to progress in the Check for Popups process...")
+
+    @staticmethod
+    def _wait_for_frame_change(timeout: float = 1.0, interval: float = 0.1) -> bool:
+        """Wait for the screen to differ from the current frame, returning as soon as it does instead of sleeping a fixed amount.
+
+        Args:
+            timeout (float, optional): Maximum time in seconds to wait for a change. Defaults to 1.0.
+            interval (float, optional): Delay in seconds between checks. Defaults to 0.1.
+
+        Returns:
+            (bool): True if the screen changed before the timeout. Otherwise, False.
+        """
+        baseline = ImageUtils.hash_frame(ImageUtils.grab_window())
+        deadline = time.time() + timeout
+
+        while time.time() < deadline:
+            time.sleep(interval)
+            if ImageUtils.hash_frame(ImageUtils.grab_window()) != baseline:
+                return True
 
         return False
 
@@ -817,7 +947,7 @@ class Game:
         """
         if Game.find_and_click_button("tap_here_to_see_rewards", tries = 10):
             MessageLog.print_message(f"[INFO] Clearing this Pending Battle...")
-            Game.wait(1)
+            Game._wait_for_frame_change(timeout = 1.0)
 
             # If there is loot available, start loot detection.
             if ImageUtils.confirm_location("no_loot", disable_adjustment = True):
@@ -861,8 +991,11 @@ class Game:
         Returns:
             None
         """
-        if ImageUtils.confirm_location("skyscope"):
-            Game.find_and_click_button("close")
+        screen = ImageUtils.grab_window()
+        if ImageUtils.confirm_location("skyscope", screenshot = screen):
+            location = ImageUtils.find_button("close", screenshot = screen)
+            if location is not None:
+                MouseUtils.move_and_click_point(location[0], location[1], "close")
             Game.wait(2.0)
         return None
 
@@ -880,21 +1013,36 @@ class Game:
         else:
             Game.wait(1)
 
-        if ImageUtils.confirm_location("check_your_pending_battles", tries = 2, bypass_general_adjustment = True) or \
-                ImageUtils.confirm_location("pending_battles", tries = 2, bypass_general_adjustment = True) or \
-                Game.find_and_click_button("quest_results_pending_battles", tries = 2, bypass_general_adjustment = True):
+        # Check all the Pending Battles indicators against one shared frame per attempt instead of each taking its own screenshots.
+        pending_found = False
+        for _ in range(2):
+            screen = ImageUtils.grab_window()
+
+            if ImageUtils.confirm_any(["check_your_pending_battles", "pending_battles"], screenshot = screen) is not None:
+                pending_found = True
+                break
+
+            location = ImageUtils.find_button("quest_results_pending_battles", tries = 1, suppress_error = True, bypass_general_adjustment = True, screenshot = screen)
+            if location is not None:
+                MouseUtils.move_and_click_point(location[0], location[1], "quest_results_pending_battles")
+                pending_found = True
+                break
+
+        if pending_found:
             MessageLog.print_message(f"[INFO] Found Pending Battles that need collecting from.")
 
             Game.find_and_click_button("ok")
-            Game.wait(1)
+            Game._wait_for_frame_change(timeout = 1.0)
 
             if ImageUtils.confirm_location("pending_battles"):
                 # Process the current Pending Battle.
                 while Game._clear_pending_battle():
-                    # While on the Loot Collected screen, if there are more Pending Battles then head back to the Pending Battles screen.
-                    if ImageUtils.find_button("quest_results_pending_battles"):
-                        Game.find_and_click_button("quest_results_pending_battles")
-                        Game.wait(1)
+                    # While on the Loot Collected screen, if there are more Pending Battles then head back to the Pending Battles screen,
+                    # clicking the already-found location instead of matching the same template a second time.
+                    location = ImageUtils.find_button("quest_results_pending_battles")
+                    if location is not None:
+                        MouseUtils.move_and_click_point(location[0], location[1], "quest_results_pending_battles")
+                        Game._wait_for_frame_change(timeout = 1.0)
 
                         # Close the Skyscope mission popup.
                         Game.check_for_skyscope()
@@ -912,6 +1060,41 @@ class Game:
         MessageLog.print_message(f"[INFO] No Pending Battles needed to be cleared.")
         return False
 
+    @staticmethod
+    def _discord_put(message: str):
+        """Sends a message to the Discord process, doing nothing if the Discord process was never started.
+
+        Args:
+            message (str): Message to forward to the Discord process.
+
+        Returns:
+            None
+        """
+        if Game._discord_queue is not None:
+            try:
+                # Drop the message instead of stalling the bot if the Discord process has fallen behind.
+                Game._discord_queue.put_nowait(message)
+            except queue.Full:
+                pass
+
+        return None
+
+    @staticmethod
+    def _build_discord_drop_string(prefix: str, before: int, after: int, total: int) -> str:
+        """Build the Discord progress message shared by the loot collection paths.
+
+        Args:
+            prefix (str): Description of what was gained, e.g. "> 3x __Meteorite__ gained from this run".
+            before (int): Progress before this run.
+            after (int): Progress after this run.
+            total (int): Target amount to farm.
+
+        Returns:
+            (str): The formatted message, with a checkmark appended once the target is reached.
+        """
+        mark = " :white_check_mark:" if after >= total else ""
+        return f"{prefix}: **[{before} / {total}]** -> **[{after} / {total}]**{mark}"
+
     @staticmethod
     def start_discord_process():
         """Starts the Discord process.
@@ -921,6 +1104,7 @@ class Game:
         """
         if Settings.enable_discord and Settings.discord_token != "" and Settings.user_id != 0:
             MessageLog.print_message("\n[DISCORD] Starting Discord process on a new Thread...")
+            Game._discord_queue = multiprocessing.Manager().Queue(maxsize = 64)
             Game._discord_process = multiprocessing.Process(target = discord_utils.start_now, args = (Settings.discord_token, Settings.user_id, Game._discord_queue))
             Game._discord_process.start()
         else:
@@ -940,7 +1124,7 @@ class Game:
             while Game._discord_queue.empty() is False:
                 Game.wait(1.0)
 
-            Game._discord_queue.put(f"```diff\n- Terminated connection to Discord API for Granblue Automation\n```")
+            Game._discord_put(f"```diff\n- Terminated connection to Discord API for Granblue Automation\n```")
             MessageLog.print_message("[DISCORD] Terminated connection to Discord API and terminating its Thread.")
             Game.wait(1.0)
             Game._discord_process.terminate()
@@ -978,41 +1162,44 @@ class Game:
         try:
             Game.start_discord_process()
 
+            # Warm the template cache so the farming loops do not read button images from disk mid-run.
+            ImageUtils.preload_templates()
+
+            # Load the OCR models in the background while calibration and navigation run, but only when item amounts
+            # will actually need to be read off the Quest Results screen.
+            if Settings.item_is_countable:
+                ImageUtils.warm_ocr_reader()
+
             if Settings.enable_test_for_home_screen:
                 Game.go_back_home(confirm_location_check = True, test_mode = True)
                 return True
 
-            # Calibrate the dimensions of the bot window on bot launch.
+            # Calibrate the dimensions of the bot window on bot launch, reusing the previous run's calibration when it still checks out.
             if Settings.farming_mode.endswith("V2"):
                 Window.calibrate()
-            else:
+            elif Game._try_cached_calibration() is False:
                 Game._calibrate_game_window(display_info_check = True)
 
 
+            # The two banner variants only differed in how the amount line is phrased.
             if Settings.item_name != "EXP":
-                MessageLog.print_message("\n######################################################################")
-                MessageLog.print_message("######################################################################")
-                MessageLog.print_message(f"[FARM] Starting Farming Mode for {Settings.farming_mode}.")
-                MessageLog.print_message(f"[FARM] Farming {Settings.item_amount_to_farm}x {Settings.item_name} at {Settings.mission_name}.")
-                MessageLog.print_message(f"[FARM] Combat Script name: {Settings.combat_script_name}")
-                MessageLog.print_message(f"[FARM] Combat Script: {Settings.combat_script}")
-                MessageLog.print_message(f"[FARM] Summons: {Settings.summon_list}")
-                MessageLog.print_message(f"[FARM] Group #: {Settings.group_number}")
-                MessageLog.print_message(f"[FARM] Party #: {Settings.party_number}")
-                MessageLog.print_message("######################################################################")
-                MessageLog.print_message("######################################################################\n")
+                amount_message = f"[FARM] Farming {Settings.item_amount_to_farm}x {Settings.item_name} at {Settings.mission_name}."
             else:
-                MessageLog.print_message("\n######################################################################")
-                MessageLog.print_message("######################################################################")
-                MessageLog.print_message(f"[FARM] Starting Farming Mode for {Settings.farming_mode}.")
-                MessageLog.print_message(f"[FARM] Doing {Settings.item_amount_to_farm}x runs for {Settings.item_name} at {Settings.mission_name}.")
-                MessageLog.print_message(f"[FARM] Combat Script name: {Settings.combat_script_name}")
-                MessageLog.print_message(f"[FARM] Combat Script: {Settings.combat_script}")
-                MessageLog.print_message(f"[FARM] Summons: {Settings.summon_list}")
-                MessageLog.print_message(f"[FARM] Group #: {Settings.group_number}")
-                MessageLog.print_message(f"[FARM] Party #: {Settings.party_number}")
-                MessageLog.print_message("######################################################################")
-                MessageLog.print_message("######################################################################\n")
+                amount_message = f"[FARM] Doing {Settings.item_amount_to_farm}x runs for {Settings.item_name} at {Settings.mission_name}."
+
+            MessageLog.print_messages([
+                "\n######################################################################",
+                "######################################################################",
+                f"[FARM] Starting Farming Mode for {Settings.farming_mode}.",
+                amount_message,
+                f"[FARM] Combat Script name: {Settings.combat_script_name}",
+                f"[FARM] Combat Script: {Settings.combat_script}",
+                f"[FARM] Summons: {Settings.summon_list}",
+                f"[FARM] Group #: {Settings.group_number}",
+                f"[FARM] Party #: {Settings.party_number}",
+                "######################################################################",
+                "######################################################################\n"
+            ])
 
             first_run = True
             while Settings.item_amount_farmed < Settings.item_amount_to_farm:
@@ -1051,7 +1238,7 @@ class Game:
                     first_run = False
 
         except Exception as e:
-            Game._discord_queue.put(f"> Bot encountered exception in Farming Mode: \n{e}")
+            Game._discord_put(f"> Bot encountered exception in Farming Mode: \n{e}")
             exception_occurred = True
             MessageLog.print_message(f"\n[ERROR] Bot encountered exception in Farming Mode: \n{traceback.format_exc()}")
             ImageUtils.generate_alert(f"Bot encountered exception in Farming Mode: \n{e}")
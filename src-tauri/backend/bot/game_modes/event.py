@@ -54,7 +54,7 @@ class Event:
                 # Once the bot is at the Summon Selection screen, select your Summon and Party and start the mission.
                 if ImageUtils.confirm_location("select_a_summon", tries = 30):
                     Game.select_summon(Settings.nightmare_summon_list, Settings.nightmare_summon_elements_list)
-                    start_check = Game.find_party_and_start_mission(int(Settings.nightmare_group_number), int(Settings.nightmare_party_number), bypass_first_run = True)
+                    start_check = Game.find_party_and_start_mission(Settings.nightmare_group_number, Settings.nightmare_party_number, bypass_first_run = True)
 
                     # Once preparations are completed, start Combat Mode.
                     if start_check and CombatMode.start_combat_mode(is_nightmare = True):
@@ -4,8 +4,9 @@ from utils.image_utils import ImageUtils
 from utils.mouse_utils import MouseUtils
 from bot.window import Window
 from bot.combat_mode_v2 import CombatModeV2 as Combat
-from utils.parser import Parser
+from utils.parser import Parser, Action
 import numpy as np
+import random
 from time import sleep
 
 class GenericV2:
@@ -22,14 +23,23 @@ class GenericV2:
         Log.print_message(f"[GenericV2] Parsing combat script: {Settings.combat_script_name}")
         battles_seq = Parser.parse_battles(Settings.combat_script)
 
+        rng = np.random.default_rng()
+
         for battle in battles_seq:
 
             config, actions = battle
             url, summon, repeat = config
-        
+
             Log.print_message(f"[GenericV2] Start battle:{url}, total of {repeat} times")
 
-            if actions[-1][0] == "subback":
+            # Pre-generate all the random values needed for this battle block in one vectorized call each instead of dispatching
+            # into the NumPy PRNG once per iteration inside the hot loop.
+            sec_checks = rng.random(repeat)
+            waits = rng.uniform(0.1, 0.5, repeat)
+            xs = rng.integers(0, Window.width - 20, repeat)
+            ys = rng.integers(0, Window.height - 100, repeat)
+
+            if actions[-1].op == "subback":
                 # first time
                 Log.print_message(f"[GenericV2] First run with support window")
                 if Window.sub_start == None:
@@ -38,33 +48,36 @@ class GenericV2:
                 Window.goto(url)
                 Window.sub_prepare_loot()
                 # reload instead of back for first time
-                Combat.load_actions(actions[:-1] + [("_sub_reload",{})])
+                Combat.load_actions(actions[:-1] + [Action("_sub_reload", {})])
                 # start first time
-                GenericV2.single_battle_sub_back(summon)         
+                GenericV2.single_battle_sub_back(summon, custom_wait = waits[0], move_point = (xs[0], ys[0]))
                 # load the original script
                 Combat.load_actions(actions)
 
                 for i in range (1, repeat):
                     Log.print_message(f"[GenericV2] Repeat for {i} times")
-                    GenericV2.single_battle_sub_back(summon)         
+                    GenericV2.single_battle_sub_back(summon, custom_wait = waits[i], move_point = (xs[i], ys[i]))
                     Game._delay_between_runs()
-                    if (np.random.rand() > .9):
+                    if (sec_checks[i] > .9):
                         Game._move_mouse_security_check()
-    
+
             else:
-                if ("enablefullauto",{}) in actions:
-                    actions.append(('_wait_for_end' ,{}))
+                if Action("enablefullauto", {}) in actions:
+                    actions.append(Action('_wait_for_end', {}))
                 Combat.load_actions(actions)
-                
-                for i in range (0, repeat):
+
+                for i in range(repeat):
 
                     Log.print_message(f"[GenericV2] Repeat for {i+1} times")
                     Window.goto(url)
-                    
-                    GenericV2.single_battle(summon)
+
+                    # Prefetch the first frame of the Summon Selection check while the page is still settling.
+                    ImageUtils.start_screenshot_async()
+
+                    GenericV2.single_battle(summon, custom_wait = waits[i], move_point = (xs[i], ys[i]))
                     Game._delay_between_runs()
 
-                    if (np.random.rand() > .9):
+                    if (sec_checks[i] > .9):
                         Game._move_mouse_security_check()
 
         Log.print_message(f"GenericV2 successfully finish!")
@@ -72,32 +85,45 @@ class GenericV2:
     
 
     @staticmethod
-    def single_battle_sub_back(support_summon: str):
+    def single_battle_sub_back(support_summon: str, custom_wait: float = None, move_point: tuple = None):
         from bot.game import Game
         """ Method to do single raid only with getting loot in the sub window
 
         support_summon: string of the support summon
+        custom_wait: pre-generated wait time in seconds, generated on demand if None
+        move_point: pre-generated (x, y) resting point for the mouse, generated on demand if None
         """
-        GenericV2.single_battle(support_summon)
+        GenericV2.single_battle(support_summon, custom_wait = custom_wait, move_point = move_point)
         if not ImageUtils.find_button("ok", tries = 30, is_sub=True):
             raise RuntimeError("Failed to reach loot page")
         Game.find_and_click_button("home_back")
+        # Prefetch the first frame for the next battle's Summon Selection check while the page reloads.
+        ImageUtils.start_screenshot_async()
 
     @staticmethod
-    def single_battle(support_summon: str):
+    def single_battle(support_summon: str, custom_wait: float = None, move_point: tuple = None):
         from bot.game import Game
         """ Standart method to do a battle
+
+        support_summon: string of the support summon
+        custom_wait: pre-generated wait time in seconds, generated on demand if None
+        move_point: pre-generated (x, y) resting point for the mouse, generated on demand if None
         """
-        if not ImageUtils.confirm_location("select_a_summon", tries = 30):
+        # The standalone fallbacks draw single values, where the stdlib PRNG is cheaper than a NumPy scalar dispatch.
+        if custom_wait is None:
+            custom_wait = random.uniform(0.1, 0.5)
+        if move_point is None:
+            move_point = (random.randrange(Window.width - 20), random.randrange(Window.height - 100))
+        if not ImageUtils.confirm_location_roi("select_a_summon", tries = 30):
             raise RuntimeError("Failed to arrive at the Summon Selection screen.")
         if not ImageUtils.captcha_pixel_check():
             raise RuntimeError("Abnormal page at summon selection")
         if not Game.select_summon([support_summon], Settings.summon_element_list):
             raise RuntimeError("Failed to select summon")
-        if not Game.find_and_click_button("ok", tries = 30, custom_wait=np.random.uniform(0.1,0.5)):
+        if not Game.find_and_click_button("ok", tries = 30, custom_wait=custom_wait):
             raise RuntimeError("Failed to confirm team")
-        MouseUtils.move_to(Window.start+10 + np.random.randint(Window.width-20), 
-                           Window.top+10 + np.random.randint(Window.height-100))
+        MouseUtils.move_to(Window.start+10 + move_point[0],
+                           Window.top+10 + move_point[1])
         if not Combat.start_combat_mode():
             raise RuntimeError("Failed to start combat mode")
             
\ No newline at end of file
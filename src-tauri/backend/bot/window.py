@@ -42,11 +42,22 @@ class Window():
             mouse.move_to(Window.start+160, Window.top-55)
         click()
         sleep(.03)
+
+        # Clear the clipboard first so that the poll below can tell when the copied address actually arrived, instead of
+        # padding every keystroke with pyautogui's global pause.
+        copy('')
         with hold('ctrl'):
-            press(['a', 'c'])
-        if paste() != url and not paste().startswith(pattern):
+            press(['a', 'c'], _pause=False)
+        current = ''
+        for _ in range(20):
+            current = paste()
+            if current != '':
+                break
+            sleep(.01)
+
+        if current != url and not current.startswith(pattern):
             copy(url)
-            pya.hotkey('ctrl', 'v')
+            pya.hotkey('ctrl', 'v', _pause=False)
             sleep(.03)
             press('enter')
 
@@ -110,32 +121,40 @@ class Window():
 
         left_width, bar_height = ImageUtils.get_button_dimensions("calibration_left")
         right_width, _ = ImageUtils.get_button_dimensions("calibration_right")
+
+        # One conversion to a NumPy array replaces the per-pixel getpixel scans below with vectorized comparisons.
+        img_array = np.asarray(img)
+
         for win_idx, win in enumerate(calibraion_window):
             # get back the top right coordinates
             (left_x, left_y), (right_x, _) = win
             left_x -= left_width//2
             left_y -= bar_height//2
             right_x -= right_width//2
-            # serach up to find color
-            for j in range (left_y, 3, -1):
-                # check if there are 3 consecutive pixel that match the color of browser top
-                if img.getpixel((left_x+2, j)) == img.getpixel((left_x+2, j-1))\
-                    == img.getpixel((left_x+2, j-2)) == Window.BROWSER_TOP_COLOR:
-
-                    if win_idx==0:
-                        Window.start = left_x
-                        Window.top = j+1
-                        Window.width = right_x + right_width - Window.start
-                        Window.height = left_y + bar_height - Window.top
-                    else:
-                        Window.sub_start = left_x 
-                        Window.sub_top = j+1
-                        Window.sub_width = right_x + right_width - Window.sub_start
-                        Window.sub_height = left_y + bar_height - Window.sub_top
-                    break
-            else:
+
+            # Search up the column for 3 consecutive pixels that match the color of the browser top, taking the lowest such run.
+            # cv2.inRange does the exact-color test in one SIMD call over the whole column.
+            column = img_array[:left_y + 1, left_x + 2, :3]
+            color_mask = cv2.inRange(column.reshape(-1, 1, 3), Window.BROWSER_TOP_COLOR, Window.BROWSER_TOP_COLOR).ravel() != 0
+            runs = color_mask[2:] & color_mask[1:-1] & color_mask[:-2]
+            candidates = np.flatnonzero(runs) + 2
+            candidates = candidates[candidates >= 4]
+
+            if candidates.size == 0:
                 raise RuntimeError("Cannot find consecutive color pixels on the top of browser!")
-            
+
+            j = int(candidates.max())
+            if win_idx==0:
+                Window.start = left_x
+                Window.top = j+1
+                Window.width = right_x + right_width - Window.start
+                Window.height = left_y + bar_height - Window.top
+            else:
+                Window.sub_start = left_x
+                Window.sub_top = j+1
+                Window.sub_width = right_x + right_width - Window.sub_start
+                Window.sub_height = left_y + bar_height - Window.sub_top
+
 
         ImageUtils.update_window_dimensions(
             Window.start,
@@ -0,0 +1,37 @@
+from time import sleep
+
+
+class AdaptiveSleeper:
+    """
+    Provides an exponential back-off sleep for polling loops: short waits while the screen is still changing, doubling up to a
+    cap once it goes quiet. Each polling loop owns its own instance.
+    """
+
+    def __init__(self, initial: float = 0.1, maximum: float = 1.0):
+        """
+        Args:
+            initial (float, optional): Wait time in seconds after a state change. Defaults to 0.1.
+            maximum (float, optional): Cap on the wait time in seconds. Defaults to 1.0.
+        """
+        self._initial = initial
+        self._maximum = maximum
+        self._current = initial
+
+    def wait(self):
+        """Sleep for the current interval and double it for the next call, up to the cap.
+
+        Returns:
+            None
+        """
+        sleep(self._current)
+        self._current = min(self._current * 2, self._maximum)
+        return None
+
+    def reset(self):
+        """Reset the interval back to the initial value. Call this whenever the polled state changes.
+
+        Returns:
+            None
+        """
+        self._current = self._initial
+        return None
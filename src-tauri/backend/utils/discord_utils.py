@@ -57,10 +57,19 @@ class MyClient(discord.Client):
 
             while not self.is_closed():
                 if self.current_user is not None and not self.queue.empty():
-                    message: str = self.queue.get()
+                    # Coalesce messages that arrive close together into a single DM to cut down on rate-limited HTTP requests.
+                    messages = [self.queue.get()]
+                    await asyncio.sleep(0.2)
+                    while not self.queue.empty() and len(messages) < 10:
+                        messages.append(self.queue.get())
+
+                    message: str = "\n".join(messages)
                     if Settings.debug_mode:
                         MessageLog.print_message(f"\n[DEBUG] Acquired message to send via Discord DM: {message}")
                     await self.current_user.send(content = message)
+                else:
+                    # Idle briefly instead of spinning on the queue check at full speed.
+                    await asyncio.sleep(0.1)
 
         except discord.errors.HTTPException:
             MessageLog.print_message("[DISCORD] Failed to find user using provided user ID.\n")
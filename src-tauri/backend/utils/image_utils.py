@@ -1,23 +1,34 @@
+import atexit
+import concurrent.futures
 import datetime
+import hashlib
+import operator
 import os
+import pickle
 import sys
 import codecs
 import threading
+from collections import OrderedDict, deque
 from datetime import date
 from typing import List, Tuple, Optional
 
-import PIL
 import cv2
 import easyocr
+import mss
 import numpy
 import pyautogui
-from PIL.Image import Image
-from playsound import playsound
 
 from utils.settings import Settings
 from utils.message_log import MessageLog
 from bot.window import Window
 
+# Optional Windows-only capture backend using the DXGI Desktop Duplication API, which grabs frames several times faster than
+# mss's GDI BitBlt path. mss remains the fallback everywhere.
+try:
+    import dxcam
+except ImportError:
+    dxcam = None
+
 
 class ImageUtils:
     """
@@ -36,6 +47,13 @@ class ImageUtils:
     _match_location: Tuple[int, int] = None
     _custom_scale = Settings.custom_scale
 
+    # Opt-in transparent OpenCL offload for template matching through OpenCV's T-API, enabled only when the setting is on
+    # and a usable OpenCL device is actually present.
+    _use_opencl: bool = False
+    if Settings.enable_opencl and cv2.ocl.haveOpenCL():
+        cv2.ocl.setUseOpenCL(True)
+        _use_opencl = cv2.ocl.useOpenCL()
+
     # Check if the temp folder is created in the images folder.
     _current_dir: str = os.getcwd()
     _temp_dir: str = _current_dir + "/temp/"
@@ -43,6 +61,67 @@ class ImageUtils:
         os.makedirs(_temp_dir)
 
     _reader: easyocr.Reader = None
+    _reader_lock: threading.Lock = threading.Lock()
+
+    _sct: mss.base.MSSBase = None
+
+    # Persistent capture-region dict for the calibrated main window, rebuilt only on recalibration instead of per grab.
+    _mon: dict = None
+
+    # DXcam camera handle when that backend is usable, a flag so its creation is only attempted once, and the name of the
+    # capture backend in use for diagnostics.
+    _camera = None
+    _camera_checked: bool = False
+    _capture_backend: str = "mss"
+
+    # Single-worker executor and pending future for screenshot prefetching. The worker thread keeps its own mss handle in
+    # _capture_local since mss instances are not shareable across threads.
+    _capture_executor: concurrent.futures.ThreadPoolExecutor = None
+    _pending_capture: concurrent.futures.Future = None
+    _capture_local = threading.local()
+
+    # Background screenshot pump used by the popup polling loops. It keeps only the freshest frame, so the consumer never
+    # matches against a stale one, and capture overlaps with template matching on a second core.
+    _pump_thread: threading.Thread = None
+    _pump_stop: threading.Event = None
+    _pump_frames: deque = None
+
+    # Cache of grayscale template arrays keyed by file path so that repeated searches do not hit the disk every time.
+    _template_cache: dict = {}
+
+    # Cache of half-resolution templates for the pyramid search keyed by (file path, scale) so pyrDown runs once per template.
+    _coarse_template_cache: dict = {}
+
+    # Cache of rescaled templates keyed by (file path, scale) so that the same resize is not redone on every retry of a search.
+    _scaled_template_cache: dict = {}
+
+    # Last successful match location per template path, in frame coordinates. Used as a fast path that checks a small region
+    # around the previous hit before falling back to the full-frame search, since buttons rarely move between frames.
+    _location_hints: dict = {}
+
+    # Memoized half-resolution source frame for the pyramid search. Keyed by the array identity and a frame counter bumped on
+    # every capture, so matching several templates against the same frame downsamples it only once.
+    _frame_counter: int = 0
+    _coarse_src_key: tuple = None
+    _coarse_src: dict = {}
+
+    # LRU cache of OCR results keyed by a hash of the cropped amount region, since the Loot Collected screen repeats
+    # pixel-identical crops across runs of the same mission. Persisted to disk so later sessions start warm.
+    _ocr_cache: OrderedDict = OrderedDict()
+    _ocr_cache_size: int = 256
+    _ocr_cache_file: str = _temp_dir + "ocr_cache.pkl"
+    try:
+        with open(_ocr_cache_file, "rb") as _cache_file:
+            _ocr_cache.update(pickle.load(_cache_file))
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    # Per-header state for confirm_location_roi() keyed by image name: the frame region the header was last seen in, the pixels
+    # inside that region from the previous call and the verdict that was returned for them.
+    _roi_cache: dict = {}
+
+    # Preallocated destination buffer for grayscale frames so grab_window() does not allocate a fresh array per capture.
+    _gray_buffer: numpy.ndarray = None
 
     page_key_pixel = {}
 
@@ -58,16 +137,16 @@ class ImageUtils:
             (450,500),
             (450,600)
         ]
-        scrshot = pyautogui.screenshot(region=(Window.start, Window.top, Window.width, Window.height))
+        scrshot = ImageUtils._grab_region(Window.start, Window.top, Window.width, Window.height)
         pixel_check = ImageUtils.page_key_pixel.get(page_name)
         if pixel_check is None:
             pixel = {}
             for pt in pts:
-                pixel[pt] = scrshot.getpixel(pt)
+                pixel[pt] = tuple(scrshot[pt[1], pt[0]])
             ImageUtils.page_key_pixel[page_name] = pixel
         else:
             for pt in pts:
-                if pixel_check[pt] != scrshot.getpixel(pt):
+                if pixel_check[pt] != tuple(scrshot[pt[1], pt[0]]):
                     return False
         return True
     clickable_area = {
@@ -95,6 +174,29 @@ class ImageUtils:
         Settings.window_height = window_height
         Settings.calibration_complete = True
         Settings.additional_calibration_required = additional_calibration_required
+        ImageUtils._mon = {"left": window_left, "top": window_top, "width": window_width, "height": window_height}
+
+        # The cached match locations and header regions are stored in frame coordinates, so a recalibrated window invalidates them.
+        ImageUtils._location_hints.clear()
+        ImageUtils._roi_cache.clear()
+        return None
+
+    @staticmethod
+    def reset_window_dimensions():
+        """Forget the calibrated window dimensions so captures fall back to the full screen until the next calibration.
+
+        Returns:
+            None
+        """
+        Settings.window_left = None
+        Settings.window_top = None
+        Settings.window_width = None
+        Settings.window_height = None
+        Settings.calibration_complete = False
+        Settings.additional_calibration_required = False
+        ImageUtils._mon = None
+        ImageUtils._location_hints.clear()
+        ImageUtils._roi_cache.clear()
         return None
 
     @staticmethod
@@ -107,23 +209,333 @@ class ImageUtils:
         return Settings.window_left, Settings.window_top, Settings.window_width, Settings.window_height
 
     @staticmethod
-    def _rescale(template: Image, scale: float) -> Image:
-        """Rescales the Image object using the provided factors.
+    def _get_sct() -> mss.base.MSSBase:
+        """Lazily create the shared mss screen capture instance.
+
+        Returns:
+            (mss.base.MSSBase): The shared mss instance.
+        """
+        if ImageUtils._sct is None:
+            ImageUtils._sct = mss.mss()
+        return ImageUtils._sct
+
+    @staticmethod
+    def _get_camera():
+        """Fetch the DXcam camera handle, creating it on first use when the backend is available on this platform.
+
+        Returns:
+            The dxcam camera instance, or None when the mss fallback should be used.
+        """
+        if ImageUtils._camera_checked is False:
+            ImageUtils._camera_checked = True
+            if dxcam is not None and sys.platform == "win32":
+                try:
+                    ImageUtils._camera = dxcam.create(output_color = "BGR")
+                    ImageUtils._capture_backend = "dxcam"
+                except Exception:
+                    # Desktop Duplication can be unavailable (remote sessions, odd drivers); stay on mss in that case.
+                    ImageUtils._camera = None
+        return ImageUtils._camera
+
+    @staticmethod
+    def _grab_region(left: int, top: int, width: int, height: int) -> numpy.ndarray:
+        """Capture an arbitrary screen region through mss and return it as an RGB array, bypassing pyautogui's slower
+        full-screen capture and PIL round-trip.
 
         Args:
-            template (Image): The template image to be resized.
-            scale (float): The factor to scale by.
+            left (int): X coordinate of the left edge of the region.
+            top (int): Y coordinate of the top edge of the region.
+            width (int): Width of the region.
+            height (int): Height of the region.
 
         Returns:
-            The Image object rescaled.
+            (numpy.ndarray): RGB array of the captured region.
         """
-        width = template.width
-        height = template.height
-        return template.resize(size = (int(width * scale), int(height * scale)), resample = None)
+        sct = ImageUtils._get_sct()
+        raw = numpy.asarray(sct.grab({"left": left, "top": top, "width": width, "height": height}))
+        return cv2.cvtColor(raw, cv2.COLOR_BGRA2RGB)
+
+    @staticmethod
+    def grab_window(is_sub: bool = False) -> numpy.ndarray:
+        """Take a single screenshot of the calibrated window region to be reused across multiple template matches.
+
+        Note that the returned array is a shared buffer that is overwritten by the next grab_window() call, so callers that
+        need to keep a frame across grabs must copy it.
+
+        Args:
+            is_sub (bool, optional): Flag to capture the second window instead. Defaults to False.
+
+        Returns:
+            (numpy.ndarray): Grayscale array of the captured region.
+        """
+        if is_sub:
+            region = {"left": Window.sub_start, "top": Window.sub_top, "width": Window.width, "height": Window.sub_height}
+        else:
+            region = ImageUtils._mon
+
+        # Prefer the hardware-accelerated backend when it is available for a calibrated region.
+        camera = ImageUtils._get_camera() if region is not None else None
+        if camera is not None:
+            frame = camera.grab(region = (region["left"], region["top"], region["left"] + region["width"], region["top"] + region["height"]))
+            if frame is not None:
+                if ImageUtils._gray_buffer is None or ImageUtils._gray_buffer.shape != frame.shape[:2]:
+                    ImageUtils._gray_buffer = numpy.empty(frame.shape[:2], dtype = numpy.uint8)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst = ImageUtils._gray_buffer)
+                ImageUtils._frame_counter += 1
+                return ImageUtils._gray_buffer
+            # dxcam returns None when nothing changed since the last grab; fall through to mss for a guaranteed frame.
+
+        sct = ImageUtils._get_sct()
+        if region is None:
+            region = sct.monitors[1]
+
+        # numpy.asarray wraps the capture buffer without copying it.
+        raw = numpy.asarray(sct.grab(region))
+
+        # All template matching runs on grayscale, so convert once per frame here instead of once per template search,
+        # writing into the preallocated buffer to avoid a fresh allocation per capture.
+        if ImageUtils._gray_buffer is None or ImageUtils._gray_buffer.shape != raw.shape[:2]:
+            ImageUtils._gray_buffer = numpy.empty(raw.shape[:2], dtype = numpy.uint8)
+
+        cv2.cvtColor(raw, cv2.COLOR_BGRA2GRAY, dst = ImageUtils._gray_buffer)
+        ImageUtils._frame_counter += 1
+        return ImageUtils._gray_buffer
+
+    @staticmethod
+    def _grab_window_threaded() -> numpy.ndarray:
+        """Capture the window on the prefetch worker thread using its own mss handle and a private output array.
+
+        Returns:
+            (numpy.ndarray): Grayscale array of the captured region. Unlike grab_window(), the array is not a shared buffer.
+        """
+        sct = getattr(ImageUtils._capture_local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            ImageUtils._capture_local.sct = sct
+
+        region = ImageUtils._mon if ImageUtils._mon is not None else sct.monitors[1]
+
+        raw = numpy.asarray(sct.grab(region))
+        return cv2.cvtColor(raw, cv2.COLOR_BGRA2GRAY)
+
+    @staticmethod
+    def start_screenshot_async():
+        """Kick off the next window capture on a background thread so it overlaps with clicks, waits or template matching.
+
+        The prefetched frame is consumed by the next get_async_screenshot() call. Requesting another prefetch while one is
+        still pending is a no-op.
+
+        Returns:
+            None
+        """
+        if ImageUtils._capture_executor is None:
+            ImageUtils._capture_executor = concurrent.futures.ThreadPoolExecutor(max_workers = 1)
+
+        if ImageUtils._pending_capture is None:
+            ImageUtils._pending_capture = ImageUtils._capture_executor.submit(ImageUtils._grab_window_threaded)
+
+        return None
+
+    @staticmethod
+    def get_async_screenshot() -> numpy.ndarray:
+        """Collect the frame requested by start_screenshot_async(), falling back to a synchronous capture if none is pending.
+
+        Returns:
+            (numpy.ndarray): Grayscale array of the captured region.
+        """
+        if ImageUtils._pending_capture is None:
+            return ImageUtils.grab_window()
+
+        frame = ImageUtils._pending_capture.result()
+        ImageUtils._pending_capture = None
+        ImageUtils._frame_counter += 1
+        return frame
+
+    @staticmethod
+    def _pump_loop():
+        """Continuously capture frames on the pump thread until stopped, keeping only the freshest one.
+
+        Returns:
+            None
+        """
+        while ImageUtils._pump_stop.wait(0.02) is False:
+            frame = ImageUtils._grab_window_threaded()
+            ImageUtils._pump_frames.append((frame, hashlib.blake2b(frame.tobytes(), digest_size = 8).digest()))
+        return None
+
+    @staticmethod
+    def start_screenshot_pump():
+        """Start the background screenshot pump for a polling loop. Does nothing if it is already running.
+
+        Returns:
+            None
+        """
+        if ImageUtils._pump_thread is not None and ImageUtils._pump_thread.is_alive():
+            return None
+
+        ImageUtils._pump_stop = threading.Event()
+        ImageUtils._pump_frames = deque(maxlen = 1)
+        ImageUtils._pump_thread = threading.Thread(target = ImageUtils._pump_loop, daemon = True)
+        ImageUtils._pump_thread.start()
+        return None
+
+    @staticmethod
+    def stop_screenshot_pump():
+        """Stop the background screenshot pump once the polling loop is done with it.
+
+        Returns:
+            None
+        """
+        if ImageUtils._pump_stop is not None:
+            ImageUtils._pump_stop.set()
+        if ImageUtils._pump_thread is not None:
+            # Wait for the loop to wind down so the frame buffer can be dropped without racing a final append.
+            ImageUtils._pump_thread.join()
+        ImageUtils._pump_thread = None
+
+        # Drop the leftover frame so get_latest_frame() degrades to a synchronous capture while the pump is stopped.
+        ImageUtils._pump_frames = None
+        return None
+
+    @staticmethod
+    def get_latest_frame() -> Tuple[numpy.ndarray, bytes]:
+        """Fetch the freshest frame and its hash from the pump, falling back to a synchronous capture when the pump is not
+        running or has not produced a frame yet.
+
+        Returns:
+            (Tuple[numpy.ndarray, bytes]): The frame and its 8-byte digest.
+        """
+        if ImageUtils._pump_frames:
+            try:
+                return ImageUtils._pump_frames[-1]
+            except IndexError:
+                pass
+
+        frame = ImageUtils.grab_window()
+        return frame, ImageUtils.hash_frame(frame)
+
+    @staticmethod
+    def _load_template(image_path: str) -> numpy.ndarray:
+        """Fetch the grayscale template array for the given file path, reading it from disk only on the first request.
+
+        Args:
+            image_path (str): The file path of the template image.
+
+        Returns:
+            (numpy.ndarray): Grayscale array of the template image.
+        """
+        template_array = ImageUtils._template_cache.get(image_path)
+        if template_array is None:
+            template_array = cv2.imread(image_path, 0)
+            if template_array is not None:
+                ImageUtils._template_cache[image_path] = template_array
+        return template_array
+
+    @staticmethod
+    def hash_frame(frame: numpy.ndarray) -> bytes:
+        """Compute a cheap digest of a captured frame so polling loops can tell whether the screen changed between iterations.
+
+        Args:
+            frame (numpy.ndarray): A frame from grab_window().
+
+        Returns:
+            (bytes): 8-byte digest of the frame contents.
+        """
+        return hashlib.blake2b(frame.tobytes(), digest_size = 8).digest()
+
+    @staticmethod
+    def _load_scaled_template(image_path: str, scale: float) -> numpy.ndarray:
+        """Fetch the template array resized to the given scale, computing and caching the resize only once per path and scale.
+
+        Args:
+            image_path (str): The file path of the template image.
+            scale (float): The scale to resize the template to.
+
+        Returns:
+            (numpy.ndarray): Grayscale array of the template image at the requested scale.
+        """
+        if scale == 1.0:
+            return ImageUtils._load_template(image_path)
+
+        key = (image_path, scale)
+        template_array = ImageUtils._scaled_template_cache.get(key)
+        if template_array is None:
+            template_array = ImageUtils._load_template(image_path)
+            if template_array is not None:
+                height, width = template_array.shape
+                template_array = cv2.resize(template_array, (int(width * scale), int(height * scale)), interpolation = cv2.INTER_AREA)
+                ImageUtils._scaled_template_cache[key] = template_array
+        return template_array
+
+    @staticmethod
+    def _load_coarse_template(image_path: str, scale: float, template_array: numpy.ndarray, level: int = 1) -> numpy.ndarray:
+        """Fetch the downsampled version of a template used by the pyramid search, computing it only once per path, scale and level.
+
+        Args:
+            image_path (str): The file path of the template image.
+            scale (float): The scale the template was resized to before downsampling.
+            template_array (numpy.ndarray): The full-resolution grayscale template at that scale.
+            level (int, optional): Number of pyrDown levels to apply. Defaults to 1.
+
+        Returns:
+            (numpy.ndarray): Downsampled grayscale array of the template image.
+        """
+        key = (image_path, scale, level)
+        coarse_template = ImageUtils._coarse_template_cache.get(key)
+        if coarse_template is None:
+            coarse_template = template_array
+            for _ in range(level):
+                coarse_template = cv2.pyrDown(coarse_template)
+            ImageUtils._coarse_template_cache[key] = coarse_template
+        return coarse_template
+
+    @staticmethod
+    def preload_templates():
+        """Warm the template cache with every button and header image so the farming loops never stall on disk reads.
+
+        Returns:
+            None
+        """
+        # Build the cache keys with the same forward-slash f-string format as every lookup site; glob would join the file
+        # names with the platform separator and miss the cache entirely on Windows.
+        for folder in ("buttons", "headers"):
+            folder_path = f"{ImageUtils._current_dir}/images/{folder}"
+            for file_name in os.listdir(folder_path):
+                if file_name.endswith(".jpg") is False:
+                    continue
+
+                image_path = f"{folder_path}/{file_name}"
+                template_array = ImageUtils._load_template(image_path)
+
+                # Also warm the downsampled variants that the pyramid search in _match() would otherwise compute on first use.
+                if template_array is not None and template_array.shape[0] >= 40 and template_array.shape[1] >= 40:
+                    ImageUtils._load_coarse_template(image_path, 1.0, template_array)
+                    if template_array.shape[0] >= 80 and template_array.shape[1] >= 80:
+                        ImageUtils._load_coarse_template(image_path, 1.0, template_array, 2)
+
+        MessageLog.print_message(f"[INFO] Preloaded {len(ImageUtils._template_cache)} template images into the cache.")
+        return None
+
+    @staticmethod
+    def _run_match_template(src: numpy.ndarray, template_array: numpy.ndarray) -> numpy.ndarray:
+        """Run matchTemplate, dispatching large sources through OpenCL UMats when the opt-in OpenCL path is active.
+
+        Small sources stay on the CPU since the host-to-device copies would cost more than the correlation itself.
+
+        Args:
+            src (numpy.ndarray): Grayscale source image.
+            template_array (numpy.ndarray): Grayscale template image.
+
+        Returns:
+            (numpy.ndarray): The correlation result map.
+        """
+        if ImageUtils._use_opencl and src.size >= 200000:
+            return cv2.matchTemplate(cv2.UMat(src), cv2.UMat(template_array), ImageUtils._match_method).get()
+        return cv2.matchTemplate(src, template_array, ImageUtils._match_method)
 
     @staticmethod
     def _match(image_path: str, confidence: float = 0.8, \
-               use_single_scale: bool = False, is_summon: bool = False, is_sub: bool = False) -> bool:
+               use_single_scale: bool = False, is_summon: bool = False, is_sub: bool = False, screenshot: numpy.ndarray = None) -> Optional[Tuple[int, int]]:
         """Match the given template image against the source screenshot to find a match location.
 
         Args:
@@ -132,18 +544,23 @@ class ImageUtils:
             use_single_scale: Use a range of scales if this is disabled. Otherwise, it will use the custom_scale value.
             is_summon: Crop out the plus signs on a summon template image before doing template matching.
             is_sub: if is searching on sub window.
+            screenshot: A previously captured frame from grab_window() to match against instead of taking a new screenshot.
 
         Returns:
-            (bool): True if the template was found inside the source image and False otherwise.
+            (Optional[Tuple[int, int]]): Coordinates of the match if the template was found inside the source image and None otherwise.
         """
 
         match_check = False
-        if is_sub:
-            image: Image = pyautogui.screenshot(region = (Window.sub_start, Window.sub_top, Window.width, Window.sub_height))
-        elif Settings.window_left is not None and Settings.window_top is not None and Settings.window_width is not None and Settings.window_height is not None:
-            image: Image = pyautogui.screenshot(region = (Settings.window_left, Settings.window_top, Settings.window_width, Settings.window_height))
+        match_location = None
+        if screenshot is not None:
+            # Reuse the caller's frame instead of taking a new screenshot.
+            if screenshot.ndim == 3:
+                cached_src = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+            else:
+                cached_src = screenshot
         else:
-            image: Image = pyautogui.screenshot()
+            # grab_window() resolves to the sub window, the calibrated region or the whole screen as appropriate.
+            cached_src = ImageUtils.grab_window(is_sub = is_sub)
 
         # Create the range of scales.
         scales = []
@@ -161,78 +578,138 @@ class ImageUtils:
         while len(scales) != 0:
             new_scale = scales.pop(0)
 
-            # Rescale if necessary.
-            if new_scale != 1.0:
-                template = PIL.Image.open(image_path)
-                template = ImageUtils._rescale(template, new_scale)
-                Image.save(template, f"temp/rescaled.png")
-                template_array = cv2.imread(f"temp/rescaled.png", 0)
-            else:
-                template_array = cv2.imread(image_path, 0)
+            # Rescale in memory if necessary instead of round-tripping the template through a temp file on disk.
+            template_array = ImageUtils._load_scaled_template(image_path, new_scale)
 
             if is_summon:
                 # Crop the summon template image so that plus marks would not potentially obscure any match.
                 height, width = template_array.shape
                 template_array = template_array[0:height, 0:width - int(40 * ImageUtils._custom_scale)]
 
-            image.save(f"temp/source.png")
-            src: numpy.ndarray = cv2.imread(f"temp/source.png", 0)
+            src: numpy.ndarray = cached_src
             height, width = template_array.shape
 
-            result: numpy.ndarray = cv2.matchTemplate(src, template_array, ImageUtils._match_method)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-
-            if (ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED) and min_val <= 1.0 - confidence:
-                ImageUtils._match_location = min_loc
-                match_check = True
-            elif ImageUtils._match_method != cv2.TM_SQDIFF and ImageUtils._match_method != cv2.TM_SQDIFF_NORMED and max_val >= confidence:
-                ImageUtils._match_location = max_loc
-                match_check = True
-            elif Settings.debug_mode:
-                if ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED:
-                    MessageLog.print_message(f"[WARNING] Match not found with {min_val:.4f} not <= {(1.0 - confidence):.2f} at Point {min_loc} using scale: {new_scale:.2f}.")
+            # Fast path: if this template matched before, check a small region around its last known location first. Buttons
+            # rarely move between frames, so this usually replaces the full-frame search with a tiny one.
+            hint = ImageUtils._location_hints.get((image_path, is_sub))
+            if hint is not None:
+                hint_x = max(0, hint[0] - 16)
+                hint_y = max(0, hint[1] - 16)
+                hint_src = src[hint_y:hint_y + height + 32, hint_x:hint_x + width + 32]
+
+                if hint_src.shape[0] >= height and hint_src.shape[1] >= width:
+                    result = cv2.matchTemplate(hint_src, template_array, ImageUtils._match_method)
+                    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+
+                    if (ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED) and min_val <= 1.0 - confidence:
+                        match_location = (min_loc[0] + hint_x, min_loc[1] + hint_y)
+                        match_check = True
+                    elif ImageUtils._match_method != cv2.TM_SQDIFF and ImageUtils._match_method != cv2.TM_SQDIFF_NORMED and max_val >= confidence:
+                        match_location = (max_loc[0] + hint_x, max_loc[1] + hint_y)
+                        match_check = True
+
+            # Coarse-to-fine pyramid search: match at half resolution first and only run the expensive full resolution pass on a small region
+            # around the coarse hit. Skipped for the SQDIFF methods and for templates too small to survive downsampling.
+            search_src = src
+            offset_x, offset_y = 0, 0
+            if match_check is False and ImageUtils._match_method != cv2.TM_SQDIFF and ImageUtils._match_method != cv2.TM_SQDIFF_NORMED and \
+                    height >= 40 and width >= 40 and src.shape[0] > height * 2 and src.shape[1] > width * 2:
+                # Templates large enough to survive a second downsampling get a deeper pyramid, quartering the linear
+                # resolution of the initial pass instead of halving it.
+                level = 2 if height >= 80 and width >= 80 and src.shape[0] > height * 4 and src.shape[1] > width * 4 else 1
+                factor = 2 ** level
+
+                if is_summon:
+                    # Summon templates get cropped above so their coarse variant cannot be shared through the cache.
+                    coarse_template = cv2.pyrDown(template_array)
+                    if level == 2:
+                        coarse_template = cv2.pyrDown(coarse_template)
                 else:
-                    MessageLog.print_message(f"[WARNING] Match not found with {max_val:.4f} not >= {confidence:.2f} at Point {max_loc} using scale: {new_scale:.2f}.")
+                    coarse_template = ImageUtils._load_coarse_template(image_path, new_scale, template_array, level)
 
-            if match_check:
-                region = (ImageUtils._match_location[0] + width, ImageUtils._match_location[1] + height)
-                cv2.rectangle(src, ImageUtils._match_location, region, 255, 5)
+                # Downsample the source frame only once per capture and level even when several templates are matched against it.
+                coarse_src_key = (id(src), ImageUtils._frame_counter)
+                if ImageUtils._coarse_src_key != coarse_src_key:
+                    ImageUtils._coarse_src = {1: cv2.pyrDown(src)}
+                    ImageUtils._coarse_src_key = coarse_src_key
 
+                # Snapshot the memo into a local first; a concurrent _match on a worker thread can swap the class attribute
+                # for a new frame between these accesses.
+                coarse_src = ImageUtils._coarse_src
+                if level not in coarse_src:
+                    coarse_src[level] = cv2.pyrDown(coarse_src[level - 1])
+
+                coarse_result: numpy.ndarray = ImageUtils._run_match_template(coarse_src[level], coarse_template)
+                _, coarse_max_val, _, coarse_max_loc = cv2.minMaxLoc(coarse_result)
+
+                # Use a slightly lenient threshold at the coarse level so that borderline matches still get refined at full resolution.
+                if coarse_max_val < confidence - 0.05:
+                    if Settings.debug_mode:
+                        MessageLog.print_message(f"[WARNING] Match not found with {coarse_max_val:.4f} not >= {(confidence - 0.05):.2f} at pyramid level {level} using scale: {new_scale:.2f}.")
+                    continue
+
+                offset_x = max(0, coarse_max_loc[0] * factor - 16)
+                offset_y = max(0, coarse_max_loc[1] * factor - 16)
+                search_src = src[offset_y:min(src.shape[0], coarse_max_loc[1] * factor + height + 16), offset_x:min(src.shape[1], coarse_max_loc[0] * factor + width + 16)]
+
+            if match_check is False:
+                result: numpy.ndarray = ImageUtils._run_match_template(search_src, template_array)
+                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+
+                if (ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED) and min_val <= 1.0 - confidence:
+                    match_location = (min_loc[0] + offset_x, min_loc[1] + offset_y)
+                    match_check = True
+                elif ImageUtils._match_method != cv2.TM_SQDIFF and ImageUtils._match_method != cv2.TM_SQDIFF_NORMED and max_val >= confidence:
+                    match_location = (max_loc[0] + offset_x, max_loc[1] + offset_y)
+                    match_check = True
+                elif Settings.debug_mode:
+                    if ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED:
+                        MessageLog.print_message(f"[WARNING] Match not found with {min_val:.4f} not <= {(1.0 - confidence):.2f} at Point {min_loc} using scale: {new_scale:.2f}.")
+                    else:
+                        MessageLog.print_message(f"[WARNING] Match not found with {max_val:.4f} not >= {confidence:.2f} at Point {max_loc} using scale: {new_scale:.2f}.")
+
+            if match_check:
+                # Remember where this template matched in frame coordinates to seed the fast path on the next search.
+                ImageUtils._location_hints[(image_path, is_sub)] = match_location
                 if Settings.debug_mode:
-                    cv2.imwrite(f"temp/match.png", src)
+                    # Draw the match on a copy so that a frame shared by several searches is not altered.
+                    region = (match_location[0] + width, match_location[1] + height)
+                    debug_src = src.copy()
+                    cv2.rectangle(debug_src, match_location, region, 255, 5)
+                    cv2.imwrite(f"temp/match.png", debug_src)
 
                 if Settings.farming_mode.endswith("V2"):
                     if is_sub:
-                        temp_location = list(ImageUtils._match_location)
+                        temp_location = list(match_location)
                         temp_location[0] += Window.sub_start
                         temp_location[1] += Window.sub_top
                     else:
-                        temp_location = list(ImageUtils._match_location)
+                        temp_location = list(match_location)
                         temp_location[0] += Window.start
                         temp_location[1] += Window.top
                 else:
                     if Settings.additional_calibration_required is False:
-                        temp_location = list(ImageUtils._match_location)
+                        temp_location = list(match_location)
                         temp_location[0] += int(width / 2)
                         temp_location[1] += int(height / 2)
                     else:
-                        temp_location = list(ImageUtils._match_location)
+                        temp_location = list(match_location)
                         temp_location[0] += (pyautogui.size()[0] - (pyautogui.size()[0] - Settings.window_left)) + int(width / 2)
                         temp_location[1] += (pyautogui.size()[1] - (pyautogui.size()[1] - Settings.window_top)) + int(height / 2)
 
-                ImageUtils._match_location = tuple(temp_location)
+                match_location = tuple(temp_location)
+                ImageUtils._match_location = match_location
 
                 if ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED:
                     if Settings.debug_mode:
-                        MessageLog.print_message(f"[DEBUG] Match found with {min_val:.4f} <= {confidence:.2f} at Point {ImageUtils._match_location} using scale: {new_scale:.2f}")
+                        MessageLog.print_message(f"[DEBUG] Match found with {min_val:.4f} <= {confidence:.2f} at Point {match_location} using scale: {new_scale:.2f}")
                 else:
                     if Settings.debug_mode:
-                        MessageLog.print_message(f"[DEBUG] Match found with {max_val:.4f} >= {confidence:.2f} at Point {ImageUtils._match_location} using scale: {new_scale:.2f}")
+                        MessageLog.print_message(f"[DEBUG] Match found with {max_val:.4f} >= {confidence:.2f} at Point {match_location} using scale: {new_scale:.2f}")
 
-                return True
+                return match_location
 
-        del scales
-        return False
+        return None
 
     @staticmethod
     def _match_all(image_path: str, confidence: float = 0.8, use_single_scale: bool = False) -> List[Tuple[int, ...]]:
@@ -246,10 +723,8 @@ class ImageUtils:
         Returns:
             (List[Tuple[int, ...]]): List of Tuples containing match locations.
         """
-        if Settings.window_left is not None and Settings.window_top is not None and Settings.window_width is not None and Settings.window_height is not None:
-            image: Image = pyautogui.screenshot(region = (Settings.window_left, Settings.window_top, Settings.window_width, Settings.window_height))
-        else:
-            image: Image = pyautogui.screenshot()
+        # grab_window() resolves to the calibrated region or the whole screen as appropriate.
+        cached_src = ImageUtils.grab_window()
 
         # Create the range of scales.
         scales = []
@@ -274,20 +749,13 @@ class ImageUtils:
         while match_check is False and len(scales) != 0:
             new_scale = scales.pop(0)
 
-            # Rescale if necessary.
-            if new_scale != 1.0:
-                template = PIL.Image.open(image_path)
-                template = ImageUtils._rescale(template, new_scale)
-                Image.save(template, f"temp/rescaled.png")
-                template_array = cv2.imread(f"temp/rescaled.png", 0)
-            else:
-                template_array = cv2.imread(image_path, 0)
+            # Rescale in memory if necessary instead of round-tripping the template through a temp file on disk.
+            template_array = ImageUtils._load_scaled_template(image_path, new_scale)
 
-            image.save(f"temp/source.png")
             height, width = template_array.shape
-            src: numpy.ndarray = cv2.imread(f"temp/source.png", 0)
+            src = cached_src
 
-            result: numpy.ndarray = cv2.matchTemplate(src, template_array, ImageUtils._match_method)
+            result: numpy.ndarray = ImageUtils._run_match_template(src, template_array)
             min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
 
             if (ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED) and min_val <= 1.0 - confidence:
@@ -331,7 +799,7 @@ class ImageUtils:
         while match_check:
             height, width = template_array.shape
 
-            result: numpy.ndarray = cv2.matchTemplate(src, template_array, ImageUtils._match_method)
+            result: numpy.ndarray = ImageUtils._run_match_template(src, template_array)
             min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
 
             if (ImageUtils._match_method == cv2.TM_SQDIFF or ImageUtils._match_method == cv2.TM_SQDIFF_NORMED) and min_val <= 1.0 - confidence:
@@ -399,7 +867,6 @@ class ImageUtils:
 
                 match_check = False
 
-        del scales
         return match_locations
 
     @staticmethod
@@ -457,7 +924,7 @@ class ImageUtils:
 
     @staticmethod
     def find_button(image_name: str, custom_confidence: float = Settings.confidence, tries: int = 5, suppress_error: bool = False, disable_adjustment: bool = False,
-                    bypass_general_adjustment: bool = False, test_mode: bool = False, is_sub = False) -> Optional[Tuple[int, int]]:
+                    bypass_general_adjustment: bool = False, test_mode: bool = False, is_sub = False, screenshot: numpy.ndarray = None) -> Optional[Tuple[int, int]]:
         """Find the location of the specified button.
 
         Args:
@@ -469,6 +936,7 @@ class ImageUtils:
             bypass_general_adjustment (bool, optional): Bypass using the general adjustment for the number of tries. Defaults to False.
             test_mode (bool, optional): Flag to test and get a valid scale for device compatibility. Defaults to False.
             is_sub (bool, optional): Flag to enable usage of a second window. Defaults to False.
+            screenshot (numpy.ndarray, optional): A frame from grab_window() to reuse for the first match attempt. Retries take new screenshots. Defaults to None.
 
         Returns:
             Coordinates of where the center of the button is located if image matching was successful.
@@ -491,10 +959,13 @@ class ImageUtils:
             ImageUtils._custom_scale = 0.30
 
         while new_tries > 0:
-            result_flag: bool = ImageUtils._match(f"{ImageUtils._current_dir}/images/buttons/{image_name.lower()}.jpg", confidence = custom_confidence,
-                                                  use_single_scale = Settings.enable_test_for_home_screen, is_sub = is_sub)
+            location = ImageUtils._match(f"{ImageUtils._current_dir}/images/buttons/{image_name.lower()}.jpg", confidence = custom_confidence,
+                                         use_single_scale = Settings.enable_test_for_home_screen, is_sub = is_sub, screenshot = screenshot)
 
-            if result_flag is False:
+            # A provided screenshot is only valid for the first attempt as the screen may have changed by the time a retry happens.
+            screenshot = None
+
+            if location is None:
                 if test_mode:
                     # Increment scale by 0.02 until a match is found if Test Mode is enabled.
                     ImageUtils._custom_scale += 0.02
@@ -506,17 +977,73 @@ class ImageUtils:
                     return None
             else:
                 if test_mode:
-                    MessageLog.print_message(f"[SUCCESS] Found {image_name.upper()} at {ImageUtils._match_location} with scale {ImageUtils._custom_scale:.2f}.\n\nRecommended to use " +
+                    MessageLog.print_message(f"[SUCCESS] Found {image_name.upper()} at {location} with scale {ImageUtils._custom_scale:.2f}.\n\nRecommended to use " +
                                              f"scale {(ImageUtils._custom_scale + 0.01):.2f}, {(ImageUtils._custom_scale + 0.02):.2f}, {(ImageUtils._custom_scale + 0.03):.2f} or "
                                              f"{(ImageUtils._custom_scale + 0.04):.2f}.")
 
-                return ImageUtils._match_location
+                return location
+
+        return None
+
+    @staticmethod
+    def find_any_button(button_names: List[str], custom_confidence: float = Settings.confidence, screenshot: numpy.ndarray = None) -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+        """Search a single frame for the first button that matches out of several candidates.
+
+        All candidates are matched against the same frame, amortizing the screenshot cost across the whole list instead of taking
+        a fresh capture per button like repeated find_button() calls would.
+
+        Args:
+            button_names (List[str]): Names of the button image files in the /images/buttons/ folder, in priority order.
+            custom_confidence (float, optional): Accuracy threshold for matching. Defaults to 0.8.
+            screenshot (numpy.ndarray, optional): A frame from grab_window() to reuse. A new one is taken if None. Defaults to None.
+
+        Returns:
+            Tuple of the name and location of the first matching button, or (None, None) if none of them matched.
+        """
+        if screenshot is None:
+            screenshot = ImageUtils.grab_window()
+        elif screenshot.ndim == 3:
+            # Convert once here so _match does not redo the grayscale conversion for every candidate in the list.
+            screenshot = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+
+        for button_name in button_names:
+            location = ImageUtils._match(f"{ImageUtils._current_dir}/images/buttons/{button_name.lower()}.jpg", confidence = custom_confidence, screenshot = screenshot)
+            if location is not None:
+                return button_name, location
+
+        return None, None
+
+    @staticmethod
+    def confirm_any(image_names: List[str], custom_confidence: float = Settings.confidence, screenshot: numpy.ndarray = None) -> Optional[str]:
+        """Confirm the position of the bot against several header images using one shared frame.
+
+        Counterpart to find_any_button() for headers: all candidates are matched against the same frame instead of each taking its
+        own screenshot like a chain of confirm_location() calls would.
+
+        Args:
+            image_names (List[str]): Names of the header image files in the /images/headers/ folder, in priority order.
+            custom_confidence (float, optional): Accuracy threshold for matching. Defaults to 0.8.
+            screenshot (numpy.ndarray, optional): A frame from grab_window() to reuse. A new one is taken if None. Defaults to None.
+
+        Returns:
+            The name of the first header that matched or None if none of them did.
+        """
+        if screenshot is None:
+            screenshot = ImageUtils.grab_window()
+        elif screenshot.ndim == 3:
+            # Convert once here so _match does not redo the grayscale conversion for every candidate in the list.
+            screenshot = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+
+        for image_name in image_names:
+            location = ImageUtils._match(f"{ImageUtils._current_dir}/images/headers/{image_name.lower()}_header.jpg", confidence = custom_confidence, screenshot = screenshot)
+            if location is not None:
+                return image_name
 
         return None
 
     @staticmethod
     def confirm_location(image_name: str, custom_confidence: float = Settings.confidence, tries: int = 5, suppress_error: bool = False, disable_adjustment: bool = False,
-                         bypass_general_adjustment: bool = False):
+                         bypass_general_adjustment: bool = False, screenshot: numpy.ndarray = None):
         """Confirm the position of the bot by searching for the header image.
 
         Args:
@@ -526,6 +1053,7 @@ class ImageUtils:
             suppress_error (bool, optional): Suppresses template matching error if True. Defaults to False.
             disable_adjustment (bool, optional): Disable the usage of adjustment to tries. Defaults to False.
             bypass_general_adjustment (bool, optional): Bypass using the general adjustment for the number of tries. Defaults to False.
+            screenshot (numpy.ndarray, optional): A frame from grab_window() to reuse for the first match attempt. Retries take new screenshots. Defaults to None.
 
         Returns:
             (bool): True if current location is confirmed. Otherwise, False.
@@ -547,9 +1075,12 @@ class ImageUtils:
             new_tries = Settings.adjust_support_summon_selection_screen
 
         while new_tries > 0:
-            result_flag: bool = ImageUtils._match(f"{ImageUtils._current_dir}/images/headers/{image_name.lower()}_header.jpg", custom_confidence)
+            location = ImageUtils._match(f"{ImageUtils._current_dir}/images/headers/{image_name.lower()}_header.jpg", custom_confidence, screenshot = screenshot)
+
+            # A provided screenshot is only valid for the first attempt as the screen may have changed by the time a retry happens.
+            screenshot = None
 
-            if result_flag is False:
+            if location is None:
                 new_tries -= 1
                 if new_tries <= 0:
                     if not suppress_error:
@@ -560,6 +1091,90 @@ class ImageUtils:
 
         return False
 
+    @staticmethod
+    def confirm_location_roi(image_name: str, tries: int = 5, custom_confidence: float = Settings.confidence, suppress_error: bool = False) -> bool:
+        """Confirm the position of the bot by searching for the header image, restricted to the region where it was last seen.
+
+        Once the header has been found once, subsequent calls only match inside that region instead of the full frame and skip the
+        match entirely when the pixels inside the region have not changed since the previous call, reusing the previous verdict.
+        After a few consecutive misses inside the cached region, and on the final try, the search falls back to the full frame and
+        re-seeds the region from the hit so a header that moved does not lock the bot out until recalibration. Intended for the V2
+        farming modes' polling loops where only a yes/no answer is needed, so no coordinate adjustment is applied.
+
+        Args:
+            image_name (str): Name of the header image file in the /images/headers/ folder.
+            tries (int, optional): Number of tries before failing. Defaults to 5.
+            custom_confidence (float, optional): Accuracy threshold for matching. Defaults to 0.8.
+            suppress_error (bool, optional): Suppresses template matching error if True. Defaults to False.
+
+        Returns:
+            (bool): True if current location is confirmed. Otherwise, False.
+        """
+        template_array = ImageUtils._load_scaled_template(f"{ImageUtils._current_dir}/images/headers/{image_name.lower()}_header.jpg", ImageUtils._custom_scale)
+        if template_array is None:
+            raise FileNotFoundError(f"The {image_name.lower()}_header.jpg image does not exist in the /images/headers/ folder.")
+
+        margin = 16
+        entry = ImageUtils._roi_cache.get(image_name)
+        first_attempt = True
+        roi_misses = 0
+
+        while tries > 0:
+            # The first attempt picks up a prefetched frame if the caller requested one via start_screenshot_async().
+            if first_attempt:
+                src = ImageUtils.get_async_screenshot()
+                first_attempt = False
+            else:
+                src = ImageUtils.grab_window()
+
+            # After a few consecutive misses inside the cached region, and on the final try, search the full frame in case
+            # the header now renders at a different offset than where it was first seen.
+            use_full_frame = entry is None or roi_misses >= 3 or tries == 1
+
+            if use_full_frame is False:
+                x0, y0, x1, y1 = entry["region"]
+                roi = numpy.ascontiguousarray(src[y0:y1, x0:x1])
+
+                # If the region is pixel-identical to the previous call, the verdict cannot have changed either.
+                if roi.shape == entry["pixels"].shape and numpy.count_nonzero(cv2.absdiff(roi, entry["pixels"]) > 5) == 0:
+                    if entry["verdict"]:
+                        return True
+                    roi_misses += 1
+                    tries -= 1
+                    continue
+
+                entry["pixels"] = roi.copy()
+                search_src = roi
+            else:
+                search_src = src
+
+            result = ImageUtils._run_match_template(search_src, template_array)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+
+            if max_val >= custom_confidence:
+                if use_full_frame:
+                    # Seed or re-seed the cached region from the full-frame hit.
+                    x0 = max(0, max_loc[0] - margin)
+                    y0 = max(0, max_loc[1] - margin)
+                    x1 = max_loc[0] + template_array.shape[1] + margin
+                    y1 = max_loc[1] + template_array.shape[0] + margin
+                    entry = {"region": (x0, y0, x1, y1), "pixels": numpy.ascontiguousarray(src[y0:y1, x0:x1]).copy(), "verdict": True}
+                    ImageUtils._roi_cache[image_name] = entry
+                else:
+                    entry["verdict"] = True
+                return True
+
+            if entry is not None:
+                entry["verdict"] = False
+
+            roi_misses += 1
+            tries -= 1
+
+        if not suppress_error:
+            MessageLog.print_message(f"[WARNING] Failed to confirm the bot's location at {image_name.upper()}.")
+
+        return False
+
     @staticmethod
     def find_summon(summon_list: List[str], summon_element_list: List[str], custom_confidence: float = Settings.confidence, suppress_error: bool = False):
         """Find the location of the specified Summon. Will attempt to scroll the screen down to see more Summons if the initial screen position yielded no matches.
@@ -606,6 +1221,11 @@ class ImageUtils:
             ImageUtils._summon_selection_first_run = False
 
         tries = 30
+
+        # One frame is shared by every summon search and bottom-of-page check at the current scroll position. It is refreshed
+        # whenever the screen changes through an element switch, a scroll or a reload.
+        screen = ImageUtils.grab_window()
+
         while True:
             # Reset the summon index.
             summon_index = 0
@@ -617,14 +1237,15 @@ class ImageUtils:
                         if Game.find_and_click_button(f"summon_{current_summon_element}") is False:
                             raise Exception(f"Unable to switch summon element categories from {last_summon_element.upper()} to {current_summon_element.upper()}.")
                         last_summon_element = current_summon_element
+                        screen = ImageUtils.grab_window()
 
-                result_flag: bool = ImageUtils._match(f"{ImageUtils._current_dir}/images/summons/{summon_list[summon_index]}.jpg", custom_confidence, is_summon = True)
+                summon_location = ImageUtils._match(f"{ImageUtils._current_dir}/images/summons/{summon_list[summon_index]}.jpg", custom_confidence, is_summon = True, screenshot = screen)
 
-                if result_flag:
+                if summon_location is not None:
                     if Settings.debug_mode:
-                        MessageLog.print_message(f"[SUCCESS] Found {summon_list[summon_index].upper()} Summon at {ImageUtils._match_location}.")
+                        MessageLog.print_message(f"[SUCCESS] Found {summon_list[summon_index].upper()} Summon at {summon_location}.")
 
-                    return ImageUtils._match_location
+                    return summon_location
                 else:
                     if suppress_error is False:
                         MessageLog.print_message(f"[WARNING] Could not locate {summon_list[summon_index].upper()} Summon.")
@@ -633,7 +1254,7 @@ class ImageUtils:
                         summon_index += 1
                     else:
                         # Keep searching for the same summon until the bot reaches the bottom of the page. Then reset the page and move to the next summon's element.
-                        if ImageUtils.find_button("bottom_of_summon_selection", tries = 1) is not None:
+                        if ImageUtils.find_button("bottom_of_summon_selection", tries = 1, screenshot = screen) is not None:
                             summon_index += 1
                             summon_element_index += 1
 
@@ -648,10 +1269,12 @@ class ImageUtils:
                                 MouseUtils.scroll_screen(home_button[0], home_button[1] - 50, 10000)
 
                             Game.wait(1.0)
+                            screen = ImageUtils.grab_window()
                         else:
                             # If matching failed and the bottom of the page has not been reached, scroll the screen down to see more Summons and try again.
                             from utils.mouse_utils import MouseUtils
                             MouseUtils.scroll_screen(home_button[0], home_button[1] - 50, -700)
+                            screen = ImageUtils.grab_window()
 
                     tries -= 1
 
@@ -661,7 +1284,7 @@ class ImageUtils:
                 return None
 
             # If the bot reached the bottom of the page, reset Summons.
-            if ImageUtils.find_button("bottom_of_summon_selection", tries = 1) is not None:
+            if ImageUtils.find_button("bottom_of_summon_selection", tries = 1, screenshot = screen) is not None:
                 MessageLog.print_message(f"[WARNING] Bot has reached the bottom of the page and found no suitable Summons. Resetting Summons now...")
                 return None
 
@@ -669,6 +1292,7 @@ class ImageUtils:
             from utils.mouse_utils import MouseUtils
             MouseUtils.scroll_screen(home_button[0], home_button[1] - 50, -700)
             Game.wait(1.0)
+            screen = ImageUtils.grab_window()
 
     @staticmethod
     def find_all(image_name: str, is_item: bool = False, custom_confidence: float = Settings.confidence_all, hide_info: bool = False) -> List[Tuple[int, ...]]:
@@ -709,21 +1333,15 @@ class ImageUtils:
                     same_y = location[1]
                     sort_flag = False
 
-            # Sort the matched locations.
-            def first(point):
-                return point[0]
-
-            def second(point):
-                return point[1]
-
+            # Sort the matched locations. itemgetter extracts the key in C instead of calling a Python function per element.
             if sort_flag:
                 if Settings.debug_mode:
                     MessageLog.print_message(f"[DEBUG] Sorting array using first key")
-                filtered_locations.sort(key = first)
+                filtered_locations.sort(key = operator.itemgetter(0))
             else:
                 if Settings.debug_mode:
                     MessageLog.print_message(f"[DEBUG] Sorting array using second key")
-                filtered_locations.sort(key = second)
+                filtered_locations.sort(key = operator.itemgetter(1))
 
             if not hide_info:
                 MessageLog.print_message(f"[INFO] Occurrence for {image_name.upper()} found at: {filtered_locations}")
@@ -733,6 +1351,42 @@ class ImageUtils:
 
         return filtered_locations
 
+    @staticmethod
+    def _get_reader() -> easyocr.Reader:
+        """Fetch the shared EasyOCR reader, initializing it on the first call only since loading its models takes seconds.
+
+        Returns:
+            (easyocr.Reader): The shared reader instance.
+        """
+        with ImageUtils._reader_lock:
+            if ImageUtils._reader is None:
+                try:
+                    if not os.path.exists(ImageUtils._current_dir + "/backend/model/"):
+                        os.makedirs(ImageUtils._current_dir + "/backend/model/")
+
+                    MessageLog.print_message(f"\n[INFO] Initializing EasyOCR reader. This may take a few seconds...")
+                    ImageUtils._reader = easyocr.Reader(["en"], model_storage_directory = ImageUtils._current_dir + "/backend/model/", gpu = True)
+                    MessageLog.print_message(f"[INFO] EasyOCR reader initialized.")
+                except UnicodeEncodeError:
+                    # Tauri spawns the Python process using encoding cp1252 and not utf-8. Need to do this hacky way to force stdout to be utf-8 to get through
+                    # EasyOCR initialization as it uses Unicode characters. This process is not needed after EasyOCR downloads the models to the /model/ folder.
+                    MessageLog.print_message(f"\n[INFO] Seems that the models for EasyOCR has not been downloaded yet. Downloading them now after setting stdout encoding from cp1252 to utf-8...\n\n")
+                    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
+                    ImageUtils._reader = easyocr.Reader(["en"], model_storage_directory = ImageUtils._current_dir + "/backend/model/", gpu = True)
+                    MessageLog.print_message(f"\n[INFO] Models for EasyOCR has been downloaded successfully.\n\n")
+        return ImageUtils._reader
+
+    @staticmethod
+    def warm_ocr_reader():
+        """Start loading the EasyOCR models on a background thread so the first Quest Results screen does not block on them.
+
+        Returns:
+            None
+        """
+        if ImageUtils._reader is None:
+            threading.Thread(target = ImageUtils._get_reader, name = "OCRWarmupThread", daemon = True).start()
+        return None
+
     @staticmethod
     def find_farmed_items(item_name: str, take_screenshot: bool = True) -> int:
         """Detect amounts of items gained according to the desired items specified.
@@ -744,20 +1398,7 @@ class ImageUtils:
         Returns:
             (int): Amount gained for the item.
         """
-        try:
-            if not os.path.exists(ImageUtils._current_dir + "/backend/model/"):
-                os.makedirs(ImageUtils._current_dir + "/backend/model/")
-
-            MessageLog.print_message(f"\n[INFO] Initializing EasyOCR reader. This may take a few seconds...")
-            ImageUtils._reader = easyocr.Reader(["en"], model_storage_directory = ImageUtils._current_dir + "/backend/model/", gpu = True)
-            MessageLog.print_message(f"[INFO] EasyOCR reader initialized.")
-        except UnicodeEncodeError:
-            # Tauri spawns the Python process using encoding cp1252 and not utf-8. Need to do this hacky way to force stdout to be utf-8 to get through
-            # EasyOCR initialization as it uses Unicode characters. This process is not needed after EasyOCR downloads the models to the /model/ folder.
-            MessageLog.print_message(f"\n[INFO] Seems that the models for EasyOCR has not been downloaded yet. Downloading them now after setting stdout encoding from cp1252 to utf-8...\n\n")
-            sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-            ImageUtils._reader = easyocr.Reader(["en"], model_storage_directory = ImageUtils._current_dir + "/backend/model/", gpu = True)
-            MessageLog.print_message(f"\n[INFO] Models for EasyOCR has been downloaded successfully.\n\n")
+        ImageUtils._get_reader()
 
         # List of items blacklisted from using the standard confidence and instead need a custom confidence to detect them.
         blacklisted_items = ["Fire Orb", "Water Orb", "Earth Orb", "Wind Orb", "Light Orb", "Dark Orb",
@@ -811,22 +1452,34 @@ class ImageUtils:
                 top = location[1] - 5
                 width = 30
                 height = 25
-                test_image = pyautogui.screenshot(f"temp/test.png", region = (left, top, width, height))
-                # test_image.show() # Uncomment this line of code to see what the bot captured for the region of the detected text.
-                result = ImageUtils._reader.readtext(f"temp/test.png", detail = 0)
-
-                # Split any unnecessary characters in the extracted text until only the number remains.
-                result_cleaned = 0
-                if len(result) != 0:
-                    result_split = [char for char in result[0]]
-                    for char in result_split:
-                        try:
-                            if int(char):
-                                result_cleaned = int(char)
-                        except ValueError:
-                            continue
+                crop = ImageUtils._grab_region(left, top, width, height)
+                # cv2.imwrite("temp/test.png", crop[:, :, ::-1]) # Uncomment this line of code to see what the bot captured for the region of the detected text.
+
+                # Check the OCR cache first as the amount crops are frequently pixel-identical across runs of the same mission.
+                key = hashlib.blake2b(crop.tobytes(), digest_size = 16).digest()
+                result_cleaned = ImageUtils._ocr_cache.get(key)
+
+                if result_cleaned is not None:
+                    ImageUtils._ocr_cache.move_to_end(key)
                 else:
-                    result_cleaned = 1
+                    result = ImageUtils._reader.readtext(crop, detail = 0)
+
+                    # Split any unnecessary characters in the extracted text until only the number remains.
+                    result_cleaned = 0
+                    if len(result) != 0:
+                        result_split = [char for char in result[0]]
+                        for char in result_split:
+                            try:
+                                if int(char):
+                                    result_cleaned = int(char)
+                            except ValueError:
+                                continue
+                    else:
+                        result_cleaned = 1
+
+                    ImageUtils._ocr_cache[key] = result_cleaned
+                    if len(ImageUtils._ocr_cache) > ImageUtils._ocr_cache_size:
+                        ImageUtils._ocr_cache.popitem(last = False)
 
                 total_amount_farmed += result_cleaned
             else:
@@ -854,7 +1507,7 @@ class ImageUtils:
         MessageLog.print_message(f"\n[INFO] Now waiting for {image_name.upper()} to vanish from screen...")
 
         for _ in range(timeout):
-            if ImageUtils._match(f"{ImageUtils._current_dir}/images/buttons/{image_name.lower()}.jpg") is False:
+            if ImageUtils._match(f"{ImageUtils._current_dir}/images/buttons/{image_name.lower()}.jpg") is None:
                 MessageLog.print_message(f"[SUCCESS] Image successfully vanished from screen...")
                 return True
 
@@ -873,12 +1526,15 @@ class ImageUtils:
         Returns:
             (Tuple[int, int]): Tuple of the width and the height of the image.
         """
-        if Settings.custom_scale == 1.0:
-            image = PIL.Image.open(f"{ImageUtils._current_dir}/images/buttons/{image_name}.jpg")
-        else:
-            image = PIL.Image.open(f"temp/rescaled.png")
-        width, height = image.size
-        image.close()
+        # Read the dimensions off the cached template instead of opening the file again.
+        template_array = ImageUtils._load_template(f"{ImageUtils._current_dir}/images/buttons/{image_name}.jpg")
+        height, width = template_array.shape
+
+        # Scale the dimensions directly since the matcher no longer leaves a rescaled copy on disk to measure.
+        if ImageUtils._custom_scale != 1.0:
+            width = int(width * ImageUtils._custom_scale)
+            height = int(height * ImageUtils._custom_scale)
+
         return width, height
     
     @staticmethod
@@ -917,7 +1573,7 @@ class ImageUtils:
             ImageUtils._new_folder_name = f"{current_date} {current_time}"
 
         # Take a screenshot using the calibrated window dimensions.
-        new_image: PIL.Image.Image = pyautogui.screenshot(region = (Settings.window_left, Settings.window_top, Settings.window_width, Settings.window_height))
+        new_image = ImageUtils._grab_region(Settings.window_left, Settings.window_top, Settings.window_width, Settings.window_height)
 
         # Create the /results/ directory if it does not already exist.
         current_dir = os.getcwd()
@@ -931,7 +1587,7 @@ class ImageUtils:
             os.makedirs(new_dir)
 
         # Finally, save the new image into the results directory with its new file name.
-        new_image.save(f"{ImageUtils._current_dir}/results/{ImageUtils._new_folder_name}/{new_file_name}.jpg")
+        cv2.imwrite(f"{ImageUtils._current_dir}/results/{ImageUtils._new_folder_name}/{new_file_name}.jpg", new_image[:, :, ::-1])
         MessageLog.print_message(f"[INFO] Results image saved as \"{new_file_name}.jpg\" in \"{ImageUtils._new_folder_name}\" folder...")
         return None
 
@@ -946,6 +1602,8 @@ class ImageUtils:
             None
         """
         def loop_sound():
+            # Imported here so the audio stack is only loaded in the rare case an alert actually fires.
+            from playsound import playsound
             from bot.game import Game
             while True:
                 playsound(f"{ImageUtils._current_dir}/backend/CAPTCHA.mp3", block = True)
@@ -982,3 +1640,21 @@ class ImageUtils:
         ImageUtils._play_captcha_sound()
         pyautogui.alert(text = message, title = "Exception Encountered", button = "OK")
         return None
+
+    @staticmethod
+    def _save_ocr_cache():
+        """Write the OCR result cache to disk so the next session starts with it warm.
+
+        Returns:
+            None
+        """
+        try:
+            with open(ImageUtils._ocr_cache_file, "wb") as file:
+                pickle.dump(ImageUtils._ocr_cache, file)
+        except OSError:
+            pass
+        return None
+
+
+# Persist the OCR cache when the process exits.
+atexit.register(ImageUtils._save_ocr_cache)
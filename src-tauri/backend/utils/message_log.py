@@ -1,8 +1,12 @@
+import atexit
 import datetime
+import threading
+import time
 from timeit import default_timer as timer
 import inspect
 import logging
 import sys
+from typing import List
 
 
 class MessageLog:
@@ -16,6 +20,18 @@ class MessageLog:
 
     logging.basicConfig(format='%(message)s', level=logging.INFO, stream=sys.stdout)
 
+    # Buffer formatted messages and emit them in batches to amortize the cost of each logging call. A flush happens once the buffer
+    # holds enough messages or enough time has passed since the last flush, whichever comes first.
+    _buffer: List[str] = []
+    _buffer_lock = threading.Lock()
+    _last_flush = timer()
+    _flush_count = 16
+    _flush_interval = 0.25
+
+    # Memoize the formatted timestamp since its granularity is one second but it is recomputed on every logged line.
+    _last_time_second = -1
+    _last_time_string = ""
+
     @staticmethod
     def _print_time():
         """Formats the time since the bot started into a readable, printable HH:MM:SS format using timedelta.
@@ -23,7 +39,11 @@ class MessageLog:
         Returns:
             str: A formatted string that displays the elapsed time since the bot started.
         """
-        return str(datetime.timedelta(seconds = (timer() - MessageLog._starting_time))).split('.')[0]
+        seconds = int(timer() - MessageLog._starting_time)
+        if seconds != MessageLog._last_time_second:
+            MessageLog._last_time_second = seconds
+            MessageLog._last_time_string = str(datetime.timedelta(seconds = seconds))
+        return MessageLog._last_time_string
 
     @staticmethod
     def print_message(message: str):
@@ -44,11 +64,88 @@ class MessageLog:
             else:
                 new_message = MessageLog._print_time() + " " + message
 
-        try:
-            logging.info(new_message)
-        except UnicodeEncodeError:
-            # Clean out any non UTF-8 characters before printing.
-            new_message_decoded = new_message.encode("utf-8", "ignore")
-            logging.info(new_message_decoded)
+        with MessageLog._buffer_lock:
+            MessageLog._buffer.append(new_message)
+
+        if len(MessageLog._buffer) >= MessageLog._flush_count or timer() - MessageLog._last_flush > MessageLog._flush_interval:
+            MessageLog.flush()
 
         return None
+
+    @staticmethod
+    def print_messages(messages: List[str]):
+        """Format and buffer a block of messages in one pass, sharing a single timestamp and flush check across the whole block.
+
+        Args:
+            messages (List[str]): The messages to print, in order.
+
+        Returns:
+            None
+        """
+        time_string = MessageLog._print_time()
+
+        # The whole block shares one caller, so inspect the stack once instead of per message like print_message() does.
+        if MessageLog.enable_inspect_caller:
+            prefix = time_string + " " + f"[{inspect.stack()[1][3]}]"
+        else:
+            prefix = time_string + " "
+
+        with MessageLog._buffer_lock:
+            for message in messages:
+                if message.startswith("\n"):
+                    MessageLog._buffer.append("\n" + prefix + message[len("\n"):])
+                else:
+                    MessageLog._buffer.append(prefix + message)
+
+        if len(MessageLog._buffer) >= MessageLog._flush_count or timer() - MessageLog._last_flush > MessageLog._flush_interval:
+            MessageLog.flush()
+
+        return None
+
+    @staticmethod
+    def flush():
+        """Emits all buffered messages in one logging call.
+
+        Returns:
+            None
+        """
+        with MessageLog._buffer_lock:
+            buffered = MessageLog._buffer
+            MessageLog._buffer = []
+
+        if len(buffered) > 0:
+            new_message = "\n".join(buffered)
+
+            try:
+                logging.info(new_message)
+            except UnicodeEncodeError:
+                # Clean out any non UTF-8 characters before printing.
+                new_message_decoded = new_message.encode("utf-8", "ignore")
+                logging.info(new_message_decoded)
+
+        MessageLog._last_flush = timer()
+        return None
+
+
+    @staticmethod
+    def _background_flush():
+        """Periodically flush the buffer so messages logged right before a long wait still reach the frontend promptly.
+
+        Without this, lines buffered just before a sleep (e.g. the resting period between runs) would only appear once the
+        next message arrives.
+
+        Returns:
+            None
+        """
+        while True:
+            time.sleep(MessageLog._flush_interval)
+            if len(MessageLog._buffer) > 0 and timer() - MessageLog._last_flush > MessageLog._flush_interval:
+                MessageLog.flush()
+
+
+# Make sure that any messages still buffered when the process exits are not lost.
+atexit.register(MessageLog.flush)
+
+# The stdout log doubles as the frontend's live view, so keep a daemon flusher running for messages buffered right before
+# the bot goes to sleep.
+threading.Thread(target = MessageLog._background_flush, name = "MessageLogFlushThread", daemon = True).start()
@@ -1,4 +1,6 @@
+import ctypes
 import random
+import sys
 from typing import Optional
 
 import pyautogui
@@ -29,6 +31,31 @@ class MouseUtils:
         pyautogui.MINIMUM_SLEEP = 0.05
         pyautogui.PAUSE = 0.25
 
+    # Clicks can only go through the native Windows API so the fast path requires both the user setting and the platform.
+    _use_native_clicks = Settings.enable_fast_native_clicks and sys.platform == "win32"
+    if _use_native_clicks:
+        # Remove pyautogui's implicit sleep after every call since the native path handles its own timing.
+        pyautogui.PAUSE = 0
+
+    _MOUSEEVENTF_LEFTDOWN = 0x0002
+    _MOUSEEVENTF_LEFTUP = 0x0004
+
+    @staticmethod
+    def _send_input_click(x: int, y: int):
+        """Click the given screen coordinates through the native Windows API, bypassing pyautogui's per-call overhead.
+
+        Args:
+            x (int): X coordinate on the screen.
+            y (int): Y coordinate on the screen.
+
+        Returns:
+            None
+        """
+        ctypes.windll.user32.SetCursorPos(x, y)
+        ctypes.windll.user32.mouse_event(MouseUtils._MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
+        ctypes.windll.user32.mouse_event(MouseUtils._MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+        return None
+
     @staticmethod
     def move_to(x: int, y: int, custom_mouse_speed: float = 0.0):
         """Move the cursor to the coordinates on the screen.
@@ -93,19 +120,26 @@ class MouseUtils:
         if Settings.debug_mode:
             MessageLog.print_message(f"[DEBUG] New coordinates: ({new_x}, {new_y})")
 
-        MouseUtils.move_to(new_x, new_y, custom_mouse_speed = custom_mouse_speed)
-
-        if Settings.enable_bezier_curve_mouse_movement:
-            pyautogui.mouseDown()
-            sleep(np.random.uniform(0.02, 0.12))
-            pyautogui.mouseUp()
+        if MouseUtils._use_native_clicks:
+            # Jump straight to the point and click through the native API with no artificial delays.
+            MouseUtils._send_input_click(new_x, new_y)
             for i in range(0, mouse_clicks - 1):
-                sleep(np.random.uniform(0.08, 0.16))
+                sleep(np.random.uniform(0.02, 0.08))
+                MouseUtils._send_input_click(new_x, new_y)
+        else:
+            MouseUtils.move_to(new_x, new_y, custom_mouse_speed = custom_mouse_speed)
+
+            if Settings.enable_bezier_curve_mouse_movement:
                 pyautogui.mouseDown()
                 sleep(np.random.uniform(0.02, 0.12))
                 pyautogui.mouseUp()
-        else:
-            pyautogui.click(clicks=mouse_clicks)
+                for i in range(0, mouse_clicks - 1):
+                    sleep(np.random.uniform(0.08, 0.16))
+                    pyautogui.mouseDown()
+                    sleep(np.random.uniform(0.02, 0.12))
+                    pyautogui.mouseUp()
+            else:
+                pyautogui.click(clicks=mouse_clicks)
 
         # This delay is necessary as ImageUtils will take the screenshot too fast and the bot will use the last frame before clicking to navigate.
         if custom_wait is not None:
@@ -1,8 +1,15 @@
+import copy
+import re
+from collections import namedtuple
 from typing import List, Tuple, Dict, Optional
 from utils.settings import Settings
 from utils.message_log import MessageLog as Log
 from utils.debugger import Debugger as Debug
 
+# Lightweight record for a single combat action. As a tuple subclass it stays compatible with every (name, params) consumer
+# while avoiding a per-action dict of keyword machinery and giving the combat loop named field access.
+Action = namedtuple("Action", ["op", "params"])
+
 
 class Parser:
     """
@@ -10,17 +17,26 @@ class Parser:
     GenericV2
     """
 
+    # Extracts every skill/target command of a character chain in a single findall pass.
+    _CHAIN_RE = re.compile(r"\.(useskill|target)\((\d)\)")
+
+    # Parsed battle sequences keyed by the script contents and the farm amount that repeat:default resolves to, since
+    # parse_battles is deterministic in those inputs.
+    _battle_cache: dict = {}
+
     @staticmethod
     def pre_parse(text: List[str]) -> List[str]:
         """ Remove all comment and empty line and lowercased result
         """
-        result = []
-        for line in [line.strip().lower() for line in text]:
-            if line == "" or line.startswith("#") or line.startswith("/"):
+        out = []
+        append = out.append
+        for raw in text:
+            line = raw.strip().lower()
+            # A direct first-character test beats any regex dispatch for this trivial comment/blank filter.
+            if not line or line[0] in "#/":
                 continue
-            else:
-                result.append(line)
-        return result
+            append(line)
+        return out
 
     @staticmethod
     def _parse_summon(line: str) -> str:
@@ -56,38 +72,51 @@ class Parser:
         """
         ret = []
         is_skill_selected = False
-        chains = line.split('.')
-        char_idx = int(chains.pop(0)[-1])
+        char_idx = int(line.split('.', 1)[0][-1])
         if char_idx not in (1, 2, 3, 4):
             raise ValueError(
                 f"[Parser] Invalid chracter number: {char_idx}")
         if is_char_selected:
-            ret += [("changechar", {"idx": char_idx-1})]
+            ret += [Action("changechar", {"idx": char_idx-1})]
         else:
-            ret += [("selectchar", {"idx": char_idx-1})]
+            ret += [Action("selectchar", {"idx": char_idx-1})]
 
-        for cmd in chains:
-            if cmd.startswith('useskill'):
-                skill_idx = int(cmd[-2])
-                if skill_idx not in (1, 2, 3, 4):
+        for cmd, idx in Parser._CHAIN_RE.findall(line):
+            idx = int(idx)
+            if cmd == 'useskill':
+                if idx not in (1, 2, 3, 4):
                     raise ValueError(
-                        f"[Parser] Invalid skill number: {skill_idx}")
-                ret += [("useskill", {"idx": skill_idx-1})]
+                        f"[Parser] Invalid skill number: {idx}")
+                ret += [Action("useskill", {"idx": idx-1})]
                 is_skill_selected = True
-            elif cmd.startswith('target'):
-                target_idx = int(cmd[-2])
-                if target_idx not in (1, 2, 3, 4, 5, 6):
+            else:
+                if idx not in (1, 2, 3, 4, 5, 6):
                     raise ValueError(
-                        f"[Parser] Invalid skill target number: {target_idx}")
+                        f"[Parser] Invalid skill target number: {idx}")
                 if not is_skill_selected:
                     raise RuntimeError(
                         f"[Parser] Select a skill before picking a target")
-                ret += [('target', {"idx": target_idx-1})]
+                ret += [Action('target', {"idx": idx-1})]
                 is_skill_selected = False
         return ret
 
     @staticmethod
     def parse_battles(text: List[str]) -> List[Tuple[Tuple[str, str, int], ...]]:
+        """ Parse list of battles into list, reusing a cached parse when the same script was seen before
+
+        Returns:
+            list of battle informations (url, summon, repeats) and combact action
+        """
+        key = (tuple(text), Settings.item_amount_to_farm)
+        cached = Parser._battle_cache.get(key)
+        if cached is None:
+            cached = Parser._parse_battles_uncached(text)
+            Parser._battle_cache[key] = cached
+        # Callers mutate the action lists, so hand out a deep copy instead of the cached parse itself.
+        return copy.deepcopy(cached)
+
+    @staticmethod
+    def _parse_battles_uncached(text: List[str]) -> List[Tuple[Tuple[str, str, int], ...]]:
         """ Parse list of battles into list
 
         Returns:
@@ -95,22 +124,27 @@ class Parser:
         """
         text = Parser.pre_parse(text)
 
-        url: str = Parser._parse_url(text.pop(0))
-        summon: str = Parser._parse_summon(text.pop(0))
-        repeat: int = Parser._parse_repeat(text.pop(0))
+        # Walk the token list with an index cursor; pop(0) shifts the whole remaining list on every consumed line.
+        i = 0
+        url: str = Parser._parse_url(text[i])
+        summon: str = Parser._parse_summon(text[i + 1])
+        repeat: int = Parser._parse_repeat(text[i + 2])
+        i += 3
         combact = []
         ret = []
 
-        while len(text) > 0:
-            line = text.pop(0)
+        while i < len(text):
+            line = text[i]
+            i += 1
             if not line.startswith("http"):
                 combact.append(line)
             else:
                 ret.append(
                     ((url, summon, repeat), Parser._parse_combact(combact)))
                 url = line
-                summon = Parser._parse_summon(text.pop(0))
-                repeat: int = Parser._parse_repeat(text.pop(0))
+                summon = Parser._parse_summon(text[i])
+                repeat: int = Parser._parse_repeat(text[i + 1])
+                i += 2
                 combact = []
         # end
         ret.append(
@@ -134,28 +168,28 @@ class Parser:
                 ret += Parser._parse_character(line, is_char_selected)
                 is_char_selected = True
             elif line.startswith("wait"):
-                ret += [("wait", {"time": int(line[5:-1])})]
+                ret += [Action("wait", {"time": int(line[5:-1])})]
             elif line.startswith("summon"):
                 idx = int(line[-2])
                 if idx not in (1,2,3,4,5,6):
                     raise ValueError
                 if is_char_selected:
-                    ret += [("deselectchar", {})]
+                    ret += [Action("deselectchar", {})]
                     is_char_selected = False
-                ret += [('usesummon', {'idx': idx-1})]
+                ret += [Action('usesummon', {'idx': idx-1})]
             elif line == "attack":
                 is_char_selected = False
-                ret += [(line, {})]
+                ret += [Action(line, {})]
             elif line == "enablefullauto":
                 if is_char_selected:
-                    ret += [("deselectchar", {})]
+                    ret += [Action("deselectchar", {})]
                     is_char_selected = False
-                ret += [(line, {})]
+                ret += [Action(line, {})]
 
             else:
-                ret.append((line, {}))
+                ret.append(Action(line, {}))
 
         # finish
         if len(ret) == 0:
-            ret += [("enablefullauto", {})]
+            ret += [Action("enablefullauto", {})]
         return ret
@@ -28,15 +28,18 @@ class Settings:
     combat_elapsed_time: float = 0.0
     farming_mode: str = dictor(_data, "game.farmingMode", checknone = True)
     item_name: str = dictor(_data, "game.item", checknone = True)
+    # Whether the farmed item has a drop amount that can be counted from the Loot Collected screen. Evaluated once here instead of
+    # re-comparing item_name against every special case on each run.
+    item_is_countable: bool = item_name not in ("EXP", "Angel Halo Weapons", "Repeated Runs")
     map_name: str = dictor(_data, "game.map", checknone = True)
     mission_name: str = dictor(_data, "game.mission", checknone = True)
-    item_amount_to_farm: int = dictor(_data, "game.itemAmount", 1)
+    item_amount_to_farm: int = int(dictor(_data, "game.itemAmount", 1))
     item_amount_farmed: int = 0
     amount_of_runs_finished: int = 0
     summon_element_list: List[str] = dictor(_data, "game.summonElements", [])
     summon_list: List[str] = dictor(_data, "game.summons", [])
-    group_number: int = dictor(_data, "game.groupNumber", 1)
-    party_number: int = dictor(_data, "game.partyNumber", 1)
+    group_number: int = int(dictor(_data, "game.groupNumber", 1))
+    party_number: int = int(dictor(_data, "game.partyNumber", 1))
     debug_mode: bool = dictor(_data, "game.debugMode", False)
 
     # #### twitter ####
@@ -51,7 +54,7 @@ class Settings:
     # #### discord ####
     enable_discord: bool = dictor(_data, "discord.enableDiscordNotifications", False)
     discord_token: str = dictor(_data, "discord.discordToken", "")
-    user_id: int = dictor(_data, "discord.discordUserID", "")
+    user_id: int = int(dictor(_data, "discord.discordUserID", 0) or 0)
     # #### end of discord ####
 
     # #### api ####
@@ -59,20 +62,33 @@ class Settings:
     # #### end of api ####
 
     # #### configuration ####
-    reduce_delay_seconds: float = dictor(_data, "configuration.reduceDelaySeconds", 0.0)
+    reduce_delay_seconds: float = float(dictor(_data, "configuration.reduceDelaySeconds", 0.0))
     enable_bezier_curve_mouse_movement: bool = dictor(_data, "configuration.enableBezierCurveMouseMovement", True)
     custom_mouse_speed: float = float(dictor(_data, "configuration.mouseSpeed", 1.5))
     mouse_smoothness: float = float(dictor(_data, "configuration.mouseSmoothness", 2))
     enable_delay_between_runs: bool = dictor(_data, "configuration.enableDelayBetweenRuns", False)
-    delay_in_seconds: int = dictor(_data, "configuration.delayBetweenRuns", 15)
+    delay_in_seconds: int = int(dictor(_data, "configuration.delayBetweenRuns", 15))
     enable_randomized_delay_between_runs: bool = dictor(_data, "configuration.enableRandomizedDelayBetweenRuns", False)
-    delay_in_seconds_lower_bound: int = dictor(_data, "configuration.delayBetweenRunsLowerBound", 15)
-    delay_in_seconds_upper_bound: int = dictor(_data, "configuration.delayBetweenRunsUpperBound", 60)
+    delay_in_seconds_lower_bound: int = int(dictor(_data, "configuration.delayBetweenRunsLowerBound", 15))
+    delay_in_seconds_upper_bound: int = int(dictor(_data, "configuration.delayBetweenRunsUpperBound", 60))
     enable_refresh_during_combat: bool = dictor(_data, "configuration.enableRefreshDuringCombat", True)
     enable_auto_quick_summon: bool = dictor(_data, "configuration.enableAutoQuickSummon", False)
     enable_bypass_reset_summon: bool = dictor(_data, "configuration.enableBypassResetSummon", False)
     static_window: bool = dictor(_data, "configuration.staticWindow", True)
     enable_mouse_security_attempt_bypass: bool = dictor(_data, "configuration.enableMouseSecurityAttemptBypass", True)
+    enable_fast_native_clicks: bool = dictor(_data, "configuration.enableFastNativeClicks", False)
+    enable_opencl: bool = dictor(_data, "configuration.enableOpenCL", False)
+
+    # Validate the resting period delays once here so _delay_between_runs does not have to re-check them after every run.
+    if delay_in_seconds < 0:
+        MessageLog.print_message("\n[INFO] Provided delay in seconds for the resting period is not valid. Defaulting to 15 seconds.")
+        delay_in_seconds = 15
+    if delay_in_seconds_lower_bound < 0 or delay_in_seconds_lower_bound > delay_in_seconds_upper_bound:
+        MessageLog.print_message("\n[INFO] Provided lower bound delay in seconds for the resting period is not valid. Defaulting to 15 seconds.")
+        delay_in_seconds_lower_bound = 15
+    if delay_in_seconds_upper_bound < 0 or delay_in_seconds_upper_bound < delay_in_seconds_lower_bound:
+        MessageLog.print_message("\n[INFO] Provided upper bound delay in seconds for the resting period is not valid. Defaulting to 60 seconds.")
+        delay_in_seconds_upper_bound = 60
     # #### end of configuration ####
 
     # #### nightmare ####
@@ -82,8 +98,8 @@ class Settings:
     nightmare_combat_script: List[str] = dictor(_data, "nightmare.nightmareCombatScript", [])
     nightmare_summon_list: List[str] = dictor(_data, "nightmare.nightmareSummons", [])
     nightmare_summon_elements_list: List[str] = dictor(_data, "nightmare.nightmareSummonElements", [])
-    nightmare_group_number: int = dictor(_data, "nightmare.nightmareGroupNumber", 1)
-    nightmare_party_number: int = dictor(_data, "nightmare.nightmarePartyNumber", 1)
+    nightmare_group_number: int = int(dictor(_data, "nightmare.nightmareGroupNumber", 1))
+    nightmare_party_number: int = int(dictor(_data, "nightmare.nightmarePartyNumber", 1))
 
     _farming_modes_with_nightmares = ["Event", "Event (Token Drawboxes)", "Rise of the Beasts"]
 